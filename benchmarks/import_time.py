@@ -0,0 +1,94 @@
+"""Import-time benchmark and guard.
+
+Imports each entry module in a fresh interpreter, reports its cold import
+time and fails if it pulls in a module it must not load at startup::
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --budget 250 --repeat 5
+
+Exit status is 1 when a forbidden module is loaded or the median import time
+exceeds the budget, so the script can run as a CI step.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Heavy GUI, plotting and report libraries
+HEAVY = ('tkinter', 'matplotlib', 'reportlab', 'numpy', 'pandas')
+
+# Entry module -> modules it must not load at import time
+GUARDS = {
+    'src.core.scheduler': HEAVY,
+    'src.core.metrics': HEAVY,
+    'src.core.streaming_metrics': HEAVY,
+    'src.cli': HEAVY,
+    'src.sweep': HEAVY,
+    'src.utils.process_io': HEAVY,
+    'src.utils.workload': HEAVY,
+    'web.app': HEAVY,
+    # The GUI needs Tk and the chart, but reports load on first download
+    'src.ui.main_window': ('reportlab', 'matplotlib.pyplot', 'numpy', 'pandas'),
+}
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+def measure(module):
+    """Imports ``module`` in a fresh interpreter; returns (seconds, loaded modules)"""
+    result = subprocess.run([sys.executable, '-c', PROBE.format(module=module)],
+                            cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()
+        raise ImportError(error[-1] if error else f"cannot import {module}")
+    data = json.loads(result.stdout)
+    return data['seconds'], set(data['modules'])
+
+def forbidden_loaded(loaded, forbidden):
+    return sorted(name for name in forbidden
+                  if name in loaded or any(m.startswith(name + '.') for m in loaded))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure and guard cold import times.")
+    parser.add_argument('modules', nargs='*', default=list(GUARDS), metavar='MODULE',
+                        help="entry modules to check (default: all guarded modules)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="fresh interpreters per module; the median is reported (default: 3)")
+    parser.add_argument('--budget', type=float, default=500.0,
+                        help="maximum median import time in ms (default: 500)")
+    options = parser.parse_args(argv)
+
+    failed = False
+    for module in options.modules:
+        try:
+            runs = [measure(module) for _ in range(options.repeat)]
+        except ImportError as e:
+            # Optional dependencies (Flask, Tk) may be missing on batch nodes
+            print(f"{module:28} skipped ({e})")
+            continue
+        median_ms = statistics.median(seconds for seconds, _ in runs) * 1000
+        offenders = forbidden_loaded(runs[0][1], GUARDS.get(module, HEAVY))
+
+        status = 'ok'
+        if offenders:
+            status = f"FAIL loads {', '.join(offenders)}"
+            failed = True
+        elif median_ms > options.budget:
+            status = f"FAIL over {options.budget:.0f} ms budget"
+            failed = True
+        print(f"{module:28} {median_ms:8.1f} ms  {status}")
+
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
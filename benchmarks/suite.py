@@ -0,0 +1,221 @@
+"""Scheduler benchmark suite with scaling curves.
+
+For each workload size and scheduler this times ``Scheduler.schedule()``,
+``PerformanceMetrics.get_all_metrics()`` and serializing the timeline the way
+the web API does, then records throughput, tracemalloc peak memory and a
+log-log fit of time against size (an exponent near 1 is linear or n log n,
+near 2 is quadratic)::
+
+    python -m benchmarks.suite --quick
+    python -m benchmarks.suite --output baseline.json
+    python -m benchmarks.suite --baseline baseline.json --tolerance 0.3
+
+Exit status is 1 when a run is slower than the baseline by more than the
+tolerance or a fitted exponent grows by more than ``--exponent-tolerance``.
+"""
+
+import argparse
+import gc
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from src.core.metrics import PerformanceMetrics
+from src.core.process import Process
+from src.core.scheduler import (FCFSScheduler, SJFScheduler, RoundRobinScheduler, PriorityScheduler,
+                                SRTFScheduler, PreemptivePriorityScheduler, MultiCoreScheduler,
+                                MLFQScheduler, CFSScheduler, EDFScheduler, RateMonotonicScheduler)
+
+SIZES = (100, 1000, 10000, 100000, 1000000)
+QUICK_SIZES = (100, 1000, 10000)
+STAGES = ('schedule', 'metrics', 'serialize')
+
+SCHEDULERS = {
+    'FCFS': FCFSScheduler,
+    'SJF': SJFScheduler,
+    'RR': lambda: RoundRobinScheduler(2),
+    'Priority': PriorityScheduler,
+    'SRTF': SRTFScheduler,
+    'PreemptivePriority': PreemptivePriorityScheduler,
+    'MLFQ': MLFQScheduler,
+    'CFS': CFSScheduler,
+    'EDF': EDFScheduler,
+    'RM': RateMonotonicScheduler,
+    'MultiCore-RR': lambda: MultiCoreScheduler(4, 'RR', 2),
+}
+
+def workload(size, seed=0):
+    """Returns (pid, arrival, burst, priority, deadline) tuples at ~90% load"""
+    rng = random.Random(seed)
+    max_burst = 20
+    # Mean burst is ~10.5, so this horizon keeps one CPU about 90% busy
+    horizon = int(size * (max_burst + 1) / 2 / 0.9)
+    return [(pid, rng.randint(0, horizon), burst, rng.randint(0, 9), burst + rng.randint(0, 50))
+            for pid, burst in ((pid, rng.randint(1, max_burst)) for pid in range(size))]
+
+def serialize(timeline):
+    # Same shape as the /api/schedule timeline
+    return json.dumps([{'time': t, 'pid': str(p)} for t, p in timeline])
+
+def run_stages(factory, spec):
+    """Runs every stage once; returns {stage: seconds}"""
+    processes = [Process(*fields) for fields in spec]
+    scheduler = factory()
+    scheduler.processes = processes
+    timings = {}
+
+    start = time.perf_counter()
+    timeline = scheduler.schedule()
+    timings['schedule'] = time.perf_counter() - start
+
+    owners = getattr(scheduler, 'jobs', processes)
+    start = time.perf_counter()
+    PerformanceMetrics(owners, timeline).get_all_metrics()
+    timings['metrics'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    serialize(timeline)
+    timings['serialize'] = time.perf_counter() - start
+    return timings
+
+def peak_memory(factory, spec):
+    """Returns tracemalloc peak bytes of schedule() including its timeline"""
+    processes = [Process(*fields) for fields in spec]
+    scheduler = factory()
+    scheduler.processes = processes
+    tracemalloc.start()
+    try:
+        scheduler.schedule()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def fit_exponent(points):
+    """Least-squares slope of log(seconds) over log(size)"""
+    points = [(math.log(size), math.log(seconds)) for size, seconds in points if seconds > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if not variance:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+def run_suite(names, sizes, repeat, measure_memory=True, log=None):
+    results = []
+    for size in sizes:
+        spec = workload(size)
+        # Small runs are noisy: take the best of several
+        runs = repeat if size <= 10000 else 1
+        for name in names:
+            factory = SCHEDULERS[name]
+            best = {}
+            for _ in range(runs):
+                gc.collect()
+                for stage, seconds in run_stages(factory, spec).items():
+                    best[stage] = min(seconds, best.get(stage, seconds))
+            peak = peak_memory(factory, spec) if measure_memory else None
+            for stage in STAGES:
+                seconds = best[stage]
+                results.append({
+                    'scheduler': name,
+                    'stage': stage,
+                    'size': size,
+                    'seconds': seconds,
+                    'jobs_per_second': size / seconds if seconds else None,
+                    # Memory is measured for scheduling only
+                    'peak_bytes': peak if stage == 'schedule' else None,
+                })
+            if log:
+                log(f"{name:20} n={size:<8} schedule {best['schedule']:.4f}s  "
+                    f"metrics {best['metrics']:.4f}s  serialize {best['serialize']:.4f}s"
+                    + (f"  peak {peak / 2**20:.1f} MiB" if peak is not None else ""))
+
+    fits = {}
+    for name in names:
+        for stage in STAGES:
+            points = [(r['size'], r['seconds']) for r in results
+                      if r['scheduler'] == name and r['stage'] == stage]
+            fits[f"{name}/{stage}"] = fit_exponent(points)
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'sizes': list(sizes),
+        'results': results,
+        'exponents': fits,
+    }
+
+def compare(report, baseline, tolerance, exponent_tolerance, min_seconds=0.001):
+    """Returns regression messages against a baseline report.
+
+    Runs that took under ``min_seconds`` in the baseline are timer noise and
+    are not compared.
+    """
+    regressions = []
+    previous = {(r['scheduler'], r['stage'], r['size']): r for r in baseline['results']}
+    for result in report['results']:
+        old = previous.get((result['scheduler'], result['stage'], result['size']))
+        if (old and old['seconds'] >= min_seconds
+                and result['seconds'] > old['seconds'] * (1 + tolerance)):
+            regressions.append(
+                f"{result['scheduler']}/{result['stage']} n={result['size']}: "
+                f"{result['seconds']:.4f}s vs {old['seconds']:.4f}s baseline")
+    for key, exponent in report['exponents'].items():
+        old = baseline.get('exponents', {}).get(key)
+        if exponent is not None and old is not None and exponent > old + exponent_tolerance:
+            regressions.append(f"{key}: scaling exponent {exponent:.2f} vs {old:.2f} baseline")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every scheduler across workload sizes.")
+    parser.add_argument('--schedulers', nargs='+', choices=list(SCHEDULERS), default=list(SCHEDULERS),
+                        metavar='NAME', help="schedulers to run (default: all)")
+    parser.add_argument('--sizes', type=int, nargs='+', metavar='N',
+                        help="workload sizes (default: 1e2 to 1e6)")
+    parser.add_argument('--quick', action='store_true', help="only sizes up to 1e4")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="runs per measurement up to 1e4 processes, best is kept (default: 3)")
+    parser.add_argument('--no-memory', action='store_true', help="skip tracemalloc runs")
+    parser.add_argument('--output', metavar='FILE', help="write the JSON report to FILE")
+    parser.add_argument('--baseline', metavar='FILE', help="fail on regressions against FILE")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="allowed slowdown against the baseline (default: 0.25)")
+    parser.add_argument('--min-seconds', type=float, default=0.001,
+                        help="ignore baseline runs faster than this (default: 0.001)")
+    parser.add_argument('--exponent-tolerance', type=float, default=0.2,
+                        help="allowed growth of a fitted exponent (default: 0.2)")
+    options = parser.parse_args(argv)
+
+    sizes = options.sizes or (QUICK_SIZES if options.quick else SIZES)
+    log = lambda line: print(line, file=sys.stderr)
+    report = run_suite(options.schedulers, sizes, options.repeat, not options.no_memory, log)
+
+    for key, exponent in report['exponents'].items():
+        if exponent is not None:
+            log(f"{key:32} ~ n^{exponent:.2f}")
+
+    if options.output:
+        with open(options.output, 'w') as f:
+            json.dump(report, f, indent=4)
+    else:
+        json.dump(report, sys.stdout, indent=4)
+        print()
+
+    if options.baseline:
+        with open(options.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, options.tolerance, options.exponent_tolerance,
+                              options.min_seconds)
+        for message in regressions:
+            log(f"REGRESSION {message}")
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
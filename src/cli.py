@@ -0,0 +1,319 @@
+"""Headless batch runner.
+
+Reads ``ProcessIO`` JSON/CSV/binary traces, runs one or more scheduling algorithms on
+each and writes metrics (and optionally timelines) to stdout or files. Only
+the core package and the standard library are imported here, so the command
+starts without loading tkinter, matplotlib or reportlab.
+"""
+
+import argparse
+import copy
+import csv
+import json
+import os
+import sys
+
+from .core.metrics import PerformanceMetrics, PERCENTILES
+from .core.process_table import ProcessTable
+from .core.scheduler import (FCFSScheduler, SJFScheduler, RoundRobinScheduler, PriorityScheduler,
+                             SRTFScheduler, PreemptivePriorityScheduler, MultiCoreScheduler,
+                             MLFQScheduler, CFSScheduler, RealTimeScheduler, EDFScheduler,
+                             RateMonotonicScheduler)
+from .core.streaming_metrics import MetricsAccumulator
+from .utils.process_io import ProcessIO, ProcessIOError
+
+# Algorithm names match the web API; each factory takes the parsed options
+ALGORITHMS = {
+    'FCFS': lambda options: FCFSScheduler(),
+    'SJF': lambda options: SJFScheduler(),
+    'RR': lambda options: RoundRobinScheduler(options.quantum),
+    'Priority': lambda options: PriorityScheduler(options.aging_rate),
+    'SRTF': lambda options: SRTFScheduler(),
+    'PreemptivePriority': lambda options: PreemptivePriorityScheduler(),
+    'MLFQ': lambda options: MLFQScheduler(
+        options.levels or [options.quantum, options.quantum * 2, options.quantum * 4],
+        options.boost_interval),
+    'CFS': lambda options: CFSScheduler(),
+    'EDF': lambda options: EDFScheduler(options.horizon, RealTimeScheduler.MAX_JOBS),
+    'RM': lambda options: RateMonotonicScheduler(options.horizon, RealTimeScheduler.MAX_JOBS),
+}
+
+SUMMARY_FIELDS = ('average_waiting_time', 'average_turnaround_time', 'average_response_time',
+                  'cpu_utilization', 'throughput', 'context_switches')
+
+def load_trace(path):
+    """Reads a process trace, picking the format from the file extension"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.json':
+        return ProcessIO.import_from_json(path)
+    if extension == '.csv':
+        return ProcessIO.import_from_csv(path)
+    if extension == '.jsonl':
+        return ProcessIO.import_from_jsonl(path)
+    if extension == '.trace':
+        # Mapped, not parsed; real-time traces need Process objects for their deadlines
+        if ProcessIO.binary_has_real_time(path):
+            return ProcessIO.import_from_binary(path)
+        return ProcessIO.load_binary(path)
+    raise ProcessIOError(f"Unsupported trace format: {path} (expected .json, .jsonl, .csv or .trace)")
+
+def stream_trace(path):
+    """Returns an iterator over a trace that reads it incrementally"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.json':
+        return ProcessIO.iter_json(path)
+    if extension == '.csv':
+        return ProcessIO.iter_csv(path)
+    if extension == '.jsonl':
+        return ProcessIO.iter_jsonl(path)
+    if extension == '.trace':
+        return ProcessIO.iter_binary(path)
+    raise ProcessIOError(f"Unsupported trace format: {path} (expected .json, .jsonl, .csv or .trace)")
+
+def make_scheduler(algorithm, options):
+    if options.cores > 1:
+        if algorithm not in MultiCoreScheduler.POLICIES:
+            raise ValueError(f"Algorithm {algorithm} does not support multiple cores")
+        return MultiCoreScheduler(options.cores, algorithm, options.quantum, options.core_queue)
+    return ALGORITHMS[algorithm](options)
+
+def run(trace, processes, algorithm, options):
+    """Schedules a private copy of ``processes`` and returns one result row.
+
+    The row holds the trace and algorithm names plus flat metric values, and
+    the scheduled processes and columnar timeline under ``_processes`` and
+    ``_timeline`` for timeline output.
+    """
+    if isinstance(processes, ProcessTable):
+        # Shares the (possibly memory-mapped) input columns
+        processes = processes.clone()
+    else:
+        processes = [copy.copy(p) for p in processes]
+    scheduler = make_scheduler(algorithm, options)
+    scheduler.processes = processes
+    timeline = scheduler.schedule_columnar()
+    if isinstance(scheduler, RealTimeScheduler):
+        processes = scheduler.jobs
+
+    if isinstance(scheduler, MultiCoreScheduler):
+        metrics = PerformanceMetrics(processes, timeline, scheduler.core_timelines,
+                                     scheduler.core_busy_times)
+    else:
+        metrics = PerformanceMetrics(processes, timeline)
+
+    row = metrics_row(trace, algorithm, len(processes), metrics.summary())
+    if (not isinstance(processes, ProcessTable)
+            and any(p.absolute_deadline is not None for p in processes)):
+        row['deadline_misses'] = metrics.deadline_misses()
+        row['average_lateness'] = metrics.average_lateness()
+        row['max_lateness'] = metrics.max_lateness()
+    row['_processes'] = processes
+    row['_timeline'] = timeline
+    return row
+
+def run_stream(trace, algorithm, options):
+    """Schedules ``trace`` while reading it and returns one result row.
+
+    The trace must be sorted by arrival time. Nothing is kept per process
+    or per slice: metrics come from a ``MetricsAccumulator`` (percentiles
+    above 1024 are approximate) and timelines are written out as they are produced.
+    """
+    scheduler = make_scheduler(algorithm, options)
+    scheduler.processes = stream_trace(trace)
+    if isinstance(scheduler, MultiCoreScheduler):
+        scheduler.record_core_timelines = False
+    accumulator = MetricsAccumulator(options.cores, quantiles=MetricsAccumulator.QUANTILES)
+
+    def slices():
+        for start, end, process in scheduler.iter_schedule(accumulator.complete):
+            accumulator.append(start, end, process)
+            yield start, end, process
+
+    if options.timelines:
+        write_timeline(trace, algorithm, slices(), options.timelines, options.timeline_format)
+    else:
+        for _ in slices():
+            pass
+
+    row = metrics_row(trace, algorithm, accumulator.waiting.count, accumulator.summary())
+    if accumulator.lateness.count:
+        row['deadline_misses'] = accumulator.deadline_misses
+        row['average_lateness'] = accumulator.lateness.mean
+        row['max_lateness'] = accumulator.max_lateness
+    return row
+
+def metrics_row(trace, algorithm, count, summary):
+    """Flattens a metrics summary into one result row"""
+    row = {'trace': trace, 'algorithm': algorithm, 'processes': count}
+    for field in SUMMARY_FIELDS:
+        row[field] = summary[field]
+    for name in ('waiting_time', 'turnaround_time', 'response_time'):
+        for q, value in zip(PERCENTILES, summary[f'{name}_percentiles']):
+            row[f'{name}_p{q}'] = value
+    return row
+
+def timeline_slices(row):
+    """Yields the (start, end, process) slices of a result row"""
+    processes = row['_processes']
+    return ((start, end, processes[index]) for start, end, index in row['_timeline'])
+
+def public_fields(row):
+    return {key: value for key, value in row.items() if not key.startswith('_')}
+
+def write_text(rows, out):
+    for row in rows:
+        out.write(f"== {row['trace']} / {row['algorithm']} ==\n")
+        for key, value in public_fields(row).items():
+            if key in ('trace', 'algorithm'):
+                continue
+            if isinstance(value, float):
+                value = f"{value:.2f}"
+            out.write(f"{key}: {value}\n")
+        out.write("\n")
+
+def write_json(rows, out, with_timeline):
+    results = []
+    for row in rows:
+        result = public_fields(row)
+        if with_timeline:
+            result['timeline'] = [{'start': start, 'end': end, 'pid': process.pid}
+                                  for start, end, process in timeline_slices(row)]
+        results.append(result)
+    json.dump(results, out, indent=4)
+    out.write("\n")
+
+def write_csv(rows, out):
+    # Deadline columns only exist for some traces; take the union in order
+    fieldnames = []
+    for row in rows:
+        fieldnames.extend(key for key in public_fields(row) if key not in fieldnames)
+    writer = csv.DictWriter(out, fieldnames=fieldnames, lineterminator='\n')
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(public_fields(row))
+
+def write_timeline(trace, algorithm, slices, directory, timeline_format):
+    stem = os.path.splitext(os.path.basename(trace))[0]
+    filename = os.path.join(directory, f"{stem}-{algorithm}.{timeline_format}")
+    if timeline_format == 'json':
+        ProcessIO.export_timeline_to_json(slices, filename)
+    else:
+        ProcessIO.export_timeline_to_csv(slices, filename)
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {value}")
+    return number
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='cli.py',
+        description="Run CPU scheduling algorithms on process trace files without the GUI.",
+        epilog="Use 'cli.py sweep --help' for parallel parameter sweeps and "
+               "'cli.py convert --help' to convert traces to the binary format.")
+    parser.add_argument('traces', nargs='+', metavar='TRACE',
+                        help="process trace in ProcessIO JSON, JSON Lines, CSV or binary (.trace) format")
+    parser.add_argument('-a', '--algorithms', nargs='+', default=['FCFS'], metavar='ALGORITHM',
+                        choices=list(ALGORITHMS),
+                        help=f"algorithms to run (default: FCFS; choices: {', '.join(ALGORITHMS)})")
+    parser.add_argument('-q', '--quantum', type=positive_int, default=2,
+                        help="time quantum for RR, multi-core RR and default MLFQ levels (default: 2)")
+    parser.add_argument('--aging-rate', type=float, default=0.0,
+                        help="priority aging rate for Priority (default: 0)")
+    parser.add_argument('--levels', type=positive_int, nargs='+', metavar='QUANTUM',
+                        help="MLFQ per-level quanta (default: quantum, 2x, 4x)")
+    parser.add_argument('--boost-interval', type=positive_int,
+                        help="MLFQ priority boost interval (default: no boost)")
+    parser.add_argument('--horizon', type=positive_int,
+                        help="EDF/RM: stop releasing periodic jobs at this time "
+                             "(default: one hyperperiod)")
+    parser.add_argument('--cores', type=positive_int, default=1,
+                        help="simulate this many cores (FCFS, SJF, RR and Priority only)")
+    parser.add_argument('--core-queue', choices=MultiCoreScheduler.QUEUE_MODES, default='global',
+                        help="multi-core ready queue layout (default: global)")
+    parser.add_argument('-f', '--format', choices=('text', 'json', 'csv'), default='text',
+                        help="metrics output format (default: text)")
+    parser.add_argument('-o', '--output', metavar='FILE',
+                        help="write metrics to FILE instead of stdout")
+    parser.add_argument('--with-timeline', action='store_true',
+                        help="include each timeline in JSON output")
+    parser.add_argument('--timelines', metavar='DIR',
+                        help="write one timeline file per trace and algorithm to DIR")
+    parser.add_argument('--stream', action='store_true',
+                        help="read arrival-sorted traces incrementally instead of loading them; "
+                             "percentiles become estimates")
+    parser.add_argument('--timeline-format', choices=('csv', 'json'), default='csv',
+                        help="format of files written by --timelines (default: csv)")
+    return parser
+
+def convert_main(argv):
+    parser = argparse.ArgumentParser(
+        prog='cli.py convert',
+        description="Convert a JSON, JSON Lines or CSV trace to the memory-mappable binary format.")
+    parser.add_argument('source', metavar='TRACE', help="trace to convert")
+    parser.add_argument('destination', metavar='OUTPUT', help="binary trace to write, e.g. trace.trace")
+    options = parser.parse_args(argv)
+    try:
+        # Read incrementally; only the integer columns are held in memory
+        ProcessIO.export_to_binary(stream_trace(options.source), options.destination)
+    except (ProcessIOError, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == 'sweep':
+        # Imported here: the sweep module builds on this one
+        from .sweep import main as sweep_main
+        return sweep_main(argv[1:])
+    if argv and argv[0] == 'convert':
+        return convert_main(argv[1:])
+
+    parser = build_parser()
+    options = parser.parse_args(argv)
+    if options.aging_rate < 0:
+        parser.error("--aging-rate cannot be negative")
+    if options.with_timeline and options.format != 'json':
+        parser.error("--with-timeline requires --format json")
+    if options.stream and options.with_timeline:
+        parser.error("--with-timeline cannot be combined with --stream; use --timelines")
+    if options.stream and any(name in ('EDF', 'RM') for name in options.algorithms):
+        parser.error("EDF and RM need the whole task set and cannot --stream")
+
+    try:
+        rows = []
+        for trace in options.traces:
+            if options.stream:
+                rows.extend(run_stream(trace, algorithm, options) for algorithm in options.algorithms)
+                continue
+            processes = load_trace(trace)
+            for algorithm in options.algorithms:
+                row = run(trace, processes, algorithm, options)
+                if options.timelines:
+                    write_timeline(trace, algorithm, timeline_slices(row), options.timelines,
+                                   options.timeline_format)
+                if not options.with_timeline:
+                    # Only the metrics are needed from here on
+                    del row['_processes'], row['_timeline']
+                rows.append(row)
+
+        out = open(options.output, 'w', newline='') if options.output else sys.stdout
+        try:
+            if options.format == 'json':
+                write_json(rows, out, options.with_timeline)
+            elif options.format == 'csv':
+                write_csv(rows, out)
+            else:
+                write_text(rows, out)
+        finally:
+            if out is not sys.stdout:
+                out.close()
+    except (ProcessIOError, ValueError, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,140 @@
+import time
+from contextlib import contextmanager, nullcontext
+
+class Instrumentation:
+    """Opt-in per-phase timers and counters for one simulation run.
+
+    Wrap pipeline phases in ``with instrumentation.phase('name'):`` and
+    assign the object to ``Scheduler.instrumentation`` to have the scheduler
+    count dispatches, context switches, completions and ready-queue heap
+    operations. With ``profile=True`` every phase also runs under cProfile
+    and ``report()`` includes the hottest functions.
+    """
+
+    enabled = True
+
+    def __init__(self, profile=False):
+        self.timings = {}
+        self.counters = {}
+        self.profile = profile
+        self._profiler = None
+        if profile:
+            import cProfile
+            self._profiler = cProfile.Profile()
+
+    @contextmanager
+    def phase(self, name):
+        """Times the enclosed block, adding to any earlier time for ``name``"""
+        if self._profiler is not None:
+            self._profiler.enable()
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+            if self._profiler is not None:
+                self._profiler.disable()
+
+    def add_time(self, name, seconds):
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def counting(self, name, function):
+        """Returns ``function`` wrapped to bump counter ``name`` on every call"""
+        counters = self.counters
+        counters.setdefault(name, 0)
+
+        def counted(*args):
+            counters[name] += 1
+            return function(*args)
+        return counted
+
+    def scheduler_slices(self, scheduler, complete):
+        """Runs ``scheduler._slices`` while counting and timing it.
+
+        Only time spent producing slices is charged to the ``schedule``
+        phase, not time the consumer spends between them.
+        """
+        scheduler._heappush = self.counting('heap_pushes', scheduler._heappush)
+        scheduler._heappop = self.counting('heap_pops', scheduler._heappop)
+
+        def completed(process):
+            self.count('completions')
+            complete(process)
+
+        slices = scheduler._slices(completed)
+        dispatches = switches = 0
+        last_index = None
+        elapsed = 0.0
+        try:
+            while True:
+                if self._profiler is not None:
+                    self._profiler.enable()
+                start = time.perf_counter()
+                try:
+                    item = next(slices, None)
+                finally:
+                    elapsed += time.perf_counter() - start
+                    if self._profiler is not None:
+                        self._profiler.disable()
+                if item is None:
+                    break
+                index = item[2]
+                dispatches += 1
+                if last_index is not None and index != last_index:
+                    switches += 1
+                last_index = index
+                yield item
+        finally:
+            # Back to the class-level heapq functions
+            del scheduler._heappush, scheduler._heappop
+            self.add_time('schedule', elapsed)
+            self.count('dispatches', dispatches)
+            self.count('context_switches', switches)
+
+    def profile_stats(self, limit=20):
+        """Returns the top ``limit`` functions by cumulative time as text"""
+        if self._profiler is None:
+            return None
+        import io
+        import pstats
+        stream = io.StringIO()
+        stats = pstats.Stats(self._profiler, stream=stream)
+        stats.sort_stats('cumulative').print_stats(limit)
+        return stream.getvalue()
+
+    def report(self):
+        """Returns timings in milliseconds, counters and profile text as a dict"""
+        report = {
+            'timings_ms': {name: seconds * 1000 for name, seconds in self.timings.items()},
+            'counters': dict(self.counters),
+        }
+        if self._profiler is not None:
+            report['profile'] = self.profile_stats()
+        return report
+
+    def server_timing(self):
+        """Formats the timings as a ``Server-Timing`` header value"""
+        return ", ".join(f"{name};dur={seconds * 1000:.3f}"
+                         for name, seconds in self.timings.items())
+
+    def lines(self):
+        """Formats timings and counters for a text panel"""
+        lines = [f"{name}: {seconds * 1000:.2f} ms" for name, seconds in self.timings.items()]
+        lines.extend(f"{name}: {value}" for name, value in self.counters.items())
+        return lines
+
+class NullInstrumentation:
+    """Stand-in when instrumentation is off; every call is a no-op"""
+
+    enabled = False
+
+    def phase(self, name):
+        return nullcontext(self)
+
+    def count(self, name, amount=1):
+        pass
+
+NULL_INSTRUMENTATION = NullInstrumentation()
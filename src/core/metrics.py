@@ -1,12 +1,54 @@
+from .process_table import ProcessTable
+from .timeline import Timeline
+
+PERCENTILES = (50, 95, 99)
+
+def _percentile(sorted_values, q):
+    """Linear-interpolated percentile, matching numpy's default method"""
+    if not sorted_values:
+        return 0
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+def format_summary(summary):
+    """Formats a metrics summary dict for display"""
+    switches = summary['context_switches']
+    metrics = {
+        "Average Waiting Time": f"{summary['average_waiting_time']:.2f}",
+        "Average Turnaround Time": f"{summary['average_turnaround_time']:.2f}",
+        "Average Response Time": f"{summary['average_response_time']:.2f}",
+        "CPU Utilization": f"{summary['cpu_utilization']:.2f}%",
+        "Throughput": f"{summary['throughput']:.2f} processes/unit time",
+        "Context Switches": "n/a" if switches is None else f"{switches}",
+    }
+    # Streaming summaries leave percentiles out unless they were asked for
+    for label, key in (("Waiting Time", 'waiting_time_percentiles'),
+                       ("Turnaround Time", 'turnaround_time_percentiles'),
+                       ("Response Time", 'response_time_percentiles')):
+        if summary[key]:
+            metrics[f"{label} p50/p95/p99"] = " / ".join(f"{v:.2f}" for v in summary[key])
+    return metrics
+
 class PerformanceMetrics:
-    def __init__(self, processes, timeline):
+    def __init__(self, processes, timeline, core_timelines=None, core_busy_times=None):
+        # processes may be a list of Process objects or a ProcessTable, and
+        # timelines either (time, process) pair lists or columnar Timelines
         self.processes = processes
         self.timeline = timeline
+        # Per-core results from MultiCoreScheduler; a single CPU otherwise
+        self.core_timelines = core_timelines
+        self.core_busy_times = core_busy_times
+        self.num_cores = len(core_busy_times) if core_busy_times else 1
         self.total_time = self._calculate_total_time()
+        self._summary = None
         
     def _calculate_total_time(self):
         if not self.timeline:
             return 0
+        if isinstance(self.processes, ProcessTable):
+            return max(self.processes.completion_time)
         return max(p.completion_time for p in self.processes)
         
     def average_waiting_time(self):
@@ -31,28 +73,139 @@ class PerformanceMetrics:
         if not self.total_time:
             return 0
         total_burst = sum(p.burst_time for p in self.processes)
-        return (total_burst / self.total_time) * 100
+        return (total_burst / (self.total_time * self.num_cores)) * 100
+
+    def per_core_utilization(self):
+        if not self.total_time or not self.core_busy_times:
+            return []
+        return [(busy / self.total_time) * 100 for busy in self.core_busy_times]
         
     def throughput(self):
         if not self.total_time:
             return 0
         return len(self.processes) / self.total_time
         
+    def deadline_misses(self):
+        return sum(1 for p in self.processes if p.lateness is not None and p.lateness > 0)
+
+    def average_lateness(self):
+        lateness = [p.lateness for p in self.processes if p.lateness is not None]
+        if not lateness:
+            return 0
+        return sum(lateness) / len(lateness)
+
+    def max_lateness(self):
+        return max((p.lateness for p in self.processes if p.lateness is not None), default=0)
+
     def context_switches(self):
-        if not self.timeline:
+        if self.core_timelines:
+            return sum(self._count_switches(timeline) for timeline in self.core_timelines)
+        return self._count_switches(self.timeline)
+
+    def _count_switches(self, timeline):
+        if not timeline:
             return 0
+        # Columnar timelines identify processes by index, pair lists by object
+        if isinstance(timeline, Timeline):
+            owners = timeline.indices
+        else:
+            owners = [process for _, process in timeline]
         switches = 0
-        for i in range(1, len(self.timeline)):
-            if self.timeline[i][1] != self.timeline[i-1][1]:
+        for i in range(1, len(owners)):
+            if owners[i] != owners[i-1]:
                 switches += 1
         return switches
         
-    def get_all_metrics(self):
+    def summary(self):
+        """Returns every core metric as a number, computed once and cached.
+
+        Uses a single vectorized NumPy pass when NumPy is installed and falls
+        back to the per-metric methods otherwise. Percentile entries are
+        (p50, p95, p99) tuples.
+        """
+        if self._summary is None:
+            try:
+                import numpy as np
+            except ImportError:
+                self._summary = self._python_summary()
+            else:
+                self._summary = self._numpy_summary(np)
+        return self._summary
+
+    def _python_summary(self):
+        waiting = sorted(p.waiting_time for p in self.processes)
+        turnaround = sorted(p.turnaround_time for p in self.processes)
+        response = sorted(p.start_time - p.arrival_time for p in self.processes)
         return {
-            "Average Waiting Time": f"{self.average_waiting_time():.2f}",
-            "Average Turnaround Time": f"{self.average_turnaround_time():.2f}",
-            "Average Response Time": f"{self.average_response_time():.2f}",
-            "CPU Utilization": f"{self.cpu_utilization():.2f}%",
-            "Throughput": f"{self.throughput():.2f} processes/unit time",
-            "Context Switches": f"{self.context_switches()}"
+            'average_waiting_time': self.average_waiting_time(),
+            'average_turnaround_time': self.average_turnaround_time(),
+            'average_response_time': self.average_response_time(),
+            'cpu_utilization': self.cpu_utilization(),
+            'throughput': self.throughput(),
+            'context_switches': self.context_switches(),
+            'waiting_time_percentiles': tuple(_percentile(waiting, q) for q in PERCENTILES),
+            'turnaround_time_percentiles': tuple(_percentile(turnaround, q) for q in PERCENTILES),
+            'response_time_percentiles': tuple(_percentile(response, q) for q in PERCENTILES),
         }
+
+    def _numpy_summary(self, np):
+        count = len(self.processes)
+        if isinstance(self.processes, ProcessTable):
+            # Zero-copy views over the table's array columns
+            arrival = np.frombuffer(self.processes.arrival_time, dtype=np.int64)
+            burst = np.frombuffer(self.processes.burst_time, dtype=np.int64)
+            start = np.frombuffer(self.processes.start_time, dtype=np.int64)
+            completion = np.frombuffer(self.processes.completion_time, dtype=np.int64)
+            waiting = np.frombuffer(self.processes.waiting_time, dtype=np.int64)
+        else:
+            columns = np.array([(p.arrival_time, p.burst_time, p.start_time, p.completion_time,
+                                 p.waiting_time) for p in self.processes],
+                               dtype=np.float64).reshape(count, 5)
+            arrival, burst, start, completion, waiting = columns.T
+
+        turnaround = completion - arrival
+        response = start - arrival
+        total_time = float(completion.max()) if count and len(self.timeline) else 0
+
+        if self.core_timelines:
+            switches = sum(self._count_switches_numpy(np, t) for t in self.core_timelines)
+        else:
+            switches = self._count_switches_numpy(np, self.timeline)
+
+        def percentiles(values):
+            if not count:
+                return (0,) * len(PERCENTILES)
+            return tuple(float(v) for v in np.percentile(values, PERCENTILES))
+
+        return {
+            'average_waiting_time': float(waiting.mean()) if count else 0,
+            'average_turnaround_time': float(turnaround.mean()) if count else 0,
+            'average_response_time': float(response.mean()) if count else 0,
+            'cpu_utilization': (float(burst.sum()) / (total_time * self.num_cores)) * 100
+                               if total_time else 0,
+            'throughput': count / total_time if total_time else 0,
+            'context_switches': switches,
+            'waiting_time_percentiles': percentiles(waiting),
+            'turnaround_time_percentiles': percentiles(turnaround),
+            'response_time_percentiles': percentiles(response),
+        }
+
+    def _count_switches_numpy(self, np, timeline):
+        if not isinstance(timeline, Timeline):
+            return self._count_switches(timeline)
+        if len(timeline) < 2:
+            return 0
+        owners = np.frombuffer(timeline.indices, dtype=np.int64)
+        return int(np.count_nonzero(owners[1:] != owners[:-1]))
+
+    def get_all_metrics(self):
+        metrics = format_summary(self.summary())
+        if (not isinstance(self.processes, ProcessTable)
+                and any(p.absolute_deadline is not None for p in self.processes)):
+            metrics["Deadline Misses"] = f"{self.deadline_misses()}"
+            metrics["Average Lateness"] = f"{self.average_lateness():.2f}"
+            metrics["Max Lateness"] = f"{self.max_lateness()}"
+        if self.num_cores > 1:
+            for core, utilization in enumerate(self.per_core_utilization()):
+                metrics[f"Core {core} Utilization"] = f"{utilization:.2f}%"
+        return metrics
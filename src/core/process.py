@@ -1,9 +1,17 @@
+import copy
+
 class Process:
-    def __init__(self, pid, arrival_time, burst_time, priority=0):
+    __slots__ = ('pid', 'arrival_time', 'burst_time', 'priority', 'deadline', 'period',
+                 'remaining_time', 'start_time', 'completion_time', 'waiting_time')
+
+    def __init__(self, pid, arrival_time, burst_time, priority=0, deadline=None, period=None):
         self.pid = f"P{pid}"  # Add P prefix here
         self.arrival_time = arrival_time
         self.burst_time = burst_time
         self.priority = priority
+        # Optional real-time parameters: relative deadline and release period
+        self.deadline = deadline
+        self.period = period
         self.remaining_time = burst_time
         self.start_time = None
         self.completion_time = None
@@ -15,5 +23,30 @@ class Process:
             return 0
         return self.completion_time - self.arrival_time
 
+    @property
+    def absolute_deadline(self):
+        # Periodic tasks without an explicit deadline are due by the next release
+        relative = self.deadline if self.deadline is not None else self.period
+        if relative is None:
+            return None
+        return self.arrival_time + relative
+
+    @property
+    def lateness(self):
+        if self.completion_time is None or self.absolute_deadline is None:
+            return None
+        return self.completion_time - self.absolute_deadline
+
+    def release_job(self, number, release_time):
+        """Returns the ``number``-th job of this periodic task, released at ``release_time``"""
+        job = copy.copy(self)
+        job.pid = f"{self.pid}.{number}"
+        job.arrival_time = release_time
+        job.remaining_time = self.burst_time
+        job.start_time = None
+        job.completion_time = None
+        job.waiting_time = 0
+        return job
+
     def __str__(self):
         return self.pid  # Return just the PID for string representation
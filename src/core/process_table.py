@@ -0,0 +1,209 @@
+from array import array
+from .process import Process
+
+class ProcessRow:
+    """Process-compatible view of one row of a ``ProcessTable``.
+
+    Schedulers and metrics only use attribute access, so a row can stand in
+    for a ``Process`` while the data itself stays in the table's columns.
+    """
+
+    __slots__ = ('table', 'index')
+
+    # ProcessTable does not carry real-time parameters
+    deadline = None
+    period = None
+    absolute_deadline = None
+    lateness = None
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    @property
+    def pid(self):
+        return f"P{self.table.pid[self.index]}"
+
+    @property
+    def arrival_time(self):
+        return self.table.arrival_time[self.index]
+
+    @property
+    def burst_time(self):
+        return self.table.burst_time[self.index]
+
+    @property
+    def priority(self):
+        return self.table.priority[self.index]
+
+    @property
+    def start_time(self):
+        value = self.table.start_time[self.index]
+        return None if value == ProcessTable.UNSET else value
+
+    @start_time.setter
+    def start_time(self, value):
+        self.table.start_time[self.index] = ProcessTable.UNSET if value is None else value
+
+    @property
+    def completion_time(self):
+        value = self.table.completion_time[self.index]
+        return None if value == ProcessTable.UNSET else value
+
+    @completion_time.setter
+    def completion_time(self, value):
+        self.table.completion_time[self.index] = ProcessTable.UNSET if value is None else value
+
+    @property
+    def waiting_time(self):
+        return self.table.waiting_time[self.index]
+
+    @waiting_time.setter
+    def waiting_time(self, value):
+        self.table.waiting_time[self.index] = value
+
+    @property
+    def turnaround_time(self):
+        completion = self.completion_time
+        if completion is None:
+            return 0
+        return completion - self.arrival_time
+
+    def __eq__(self, other):
+        return (isinstance(other, ProcessRow) and other.table is self.table
+                and other.index == self.index)
+
+    def __hash__(self):
+        return hash((id(self.table), self.index))
+
+    def __str__(self):
+        return self.pid
+
+def _fill_column(column, values):
+    try:
+        view = memoryview(values)
+    except TypeError:
+        view = None
+    if view is not None and view.itemsize == 8 and view.format in ('q', 'l') and view.c_contiguous:
+        column.frombytes(view.cast('B'))
+    else:
+        column.extend(values)
+
+class ProcessTable:
+    """Columnar process set backed by ``array.array('q')`` columns.
+
+    Holds the same fields as ``Process`` at 8 bytes per value, with ``UNSET``
+    standing in for a start or completion time that is not known yet. It can
+    be assigned to ``Scheduler.processes`` directly; pair it with
+    ``Scheduler.schedule_columnar()`` to keep the timeline columnar too.
+
+    The four input columns may also be read-only ``memoryview`` objects (as
+    produced by ``ProcessIO.load_binary``); such a table cannot be appended
+    to. ``arrival_sorted`` tells schedulers they can skip sorting.
+    """
+
+    UNSET = -1
+    INPUT_COLUMNS = ('pid', 'arrival_time', 'burst_time', 'priority')
+    RESULT_COLUMNS = ('start_time', 'completion_time', 'waiting_time')
+    COLUMNS = INPUT_COLUMNS + RESULT_COLUMNS
+
+    def __init__(self):
+        for column in self.COLUMNS:
+            setattr(self, column, array('q'))
+        self.arrival_sorted = False
+
+    @classmethod
+    def from_buffers(cls, pid, arrival_time, burst_time, priority, arrival_sorted=False):
+        """Wraps existing 8-byte integer buffers as the input columns without copying.
+
+        Result columns are allocated on first use, so wrapping takes constant
+        time however many rows the buffers hold.
+        """
+        table = cls.__new__(cls)
+        for name, values in zip(cls.INPUT_COLUMNS, (pid, arrival_time, burst_time, priority)):
+            setattr(table, name, values)
+        table.arrival_sorted = arrival_sorted
+        return table
+
+    def clone(self):
+        """Returns a table sharing the input columns with fresh scheduling results.
+
+        Each scheduling run needs its own results, while the inputs can stay
+        shared, e.g. one memory-mapped trace scheduled many times.
+        """
+        return self.from_buffers(self.pid, self.arrival_time, self.burst_time, self.priority,
+                                 self.arrival_sorted)
+
+    @classmethod
+    def from_processes(cls, processes):
+        table = cls()
+        for process in processes:
+            table.append(int(str(process.pid).lstrip('P')), process.arrival_time,
+                         process.burst_time, process.priority)
+        return table
+
+    @classmethod
+    def from_columns(cls, pid, arrival_time, burst_time, priority):
+        """Builds a table from four equal-length integer columns.
+
+        Buffers of 8-byte integers, such as int64 NumPy arrays, are copied in
+        bulk; any other iterable of ints is converted element by element.
+        """
+        table = cls()
+        columns = (pid, arrival_time, burst_time, priority)
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError("Columns must all have the same length")
+        for name, values in zip(cls.INPUT_COLUMNS, columns):
+            _fill_column(getattr(table, name), values)
+        count = len(pid)
+        table.start_time = array('q', [cls.UNSET]) * count
+        table.completion_time = array('q', [cls.UNSET]) * count
+        table.waiting_time = array('q', [0]) * count
+        return table
+
+    def append(self, pid, arrival_time, burst_time, priority=0):
+        self.pid.append(pid)
+        self.arrival_time.append(arrival_time)
+        self.burst_time.append(burst_time)
+        self.priority.append(priority)
+        self.start_time.append(self.UNSET)
+        self.completion_time.append(self.UNSET)
+        self.waiting_time.append(0)
+
+    def __getattr__(self, name):
+        # Only reached for result columns not allocated yet (see from_buffers)
+        if name in ProcessTable.RESULT_COLUMNS:
+            self.reset()
+            return getattr(self, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def reset(self):
+        """Clears scheduling results so the table can be scheduled again"""
+        count = len(self)
+        self.start_time = array('q', [self.UNSET]) * count
+        self.completion_time = array('q', [self.UNSET]) * count
+        self.waiting_time = array('q', [0]) * count
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ProcessTable index out of range")
+        return ProcessRow(self, index)
+
+    def __iter__(self):
+        return (ProcessRow(self, index) for index in range(len(self)))
+
+    def to_processes(self):
+        """Materializes the table as ``Process`` objects, scheduling results included"""
+        processes = []
+        for row in self:
+            process = Process(self.pid[row.index], row.arrival_time, row.burst_time, row.priority)
+            process.start_time = row.start_time
+            process.completion_time = row.completion_time
+            process.waiting_time = row.waiting_time
+            processes.append(process)
+        return processes
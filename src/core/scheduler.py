@@ -1,157 +1,716 @@
+import heapq
+import math
+from collections import deque
 from abc import ABC, abstractmethod
 from .process import Process
-from typing import List, Tuple
+from .timeline import Timeline
+from typing import Iterator, List, Tuple
+
+def _ignore(process):
+    pass
+
+def _checked_arrivals(processes):
+    last_arrival = None
+    for index, process in enumerate(processes):
+        if last_arrival is not None and process.arrival_time < last_arrival:
+            raise ValueError(f"Process stream is not in arrival order at {process.pid}")
+        last_arrival = process.arrival_time
+        yield index, process
 
 class Scheduler(ABC):
+    # Engines push and pop their ready queues through these so instrumentation
+    # can count ready-queue heap operations; other heaps use heapq directly
+    _heappush = heapq.heappush
+    _heappop = heapq.heappop
+
     def __init__(self):
+        # A list of Process objects, a ProcessTable, or any iterator of
+        # processes already in arrival order (see _arrival_stream)
         self.processes: List[Process] = []
         self.current_time = 0
+        # Optional Instrumentation collecting timings and counters
+        self.instrumentation = None
         
-    @abstractmethod
     def schedule(self) -> List[Tuple[int, Process]]:
         """Returns a list of (time, process) pairs representing the schedule"""
+        return [(start, process) for start, _, process in self.iter_schedule()]
+
+    def iter_schedule(self, on_complete=None) -> Iterator[Tuple[int, int, Process]]:
+        """Yields (start, end, process) slices as the policy decides them.
+
+        Nothing is accumulated, so a consumer that writes slices out as they
+        arrive runs in memory bounded by the ready queue rather than the
+        timeline. ``on_complete(process)`` is called as each process finishes.
+        """
+        for start, end, _, process in self._slice_stream(on_complete or _ignore):
+            yield start, end, process
+
+    def schedule_columnar(self) -> Timeline:
+        """Returns the schedule as parallel (start, end, process index) arrays"""
+        timeline = Timeline()
+        self._run(timeline)
+        return timeline
+
+    def schedule_into(self, recorder):
+        """Runs the schedule straight into ``recorder`` without keeping a timeline.
+
+        ``recorder`` receives ``append(start, end, index)`` per slice and
+        ``complete(process)`` per finished process, e.g. a MetricsAccumulator.
+        """
+        self._run(recorder)
+        return recorder
+
+    def _run(self, recorder) -> None:
+        append = recorder.append
+        for start, end, index, _ in self._slice_stream(recorder.complete):
+            append(start, end, index)
+
+    def _slice_stream(self, complete) -> Iterator[Tuple[int, int, int, Process]]:
+        if self.instrumentation is None:
+            return self._slices(complete)
+        return self.instrumentation.scheduler_slices(self, complete)
+
+    @abstractmethod
+    def _slices(self, complete) -> Iterator[Tuple[int, int, int, Process]]:
+        """Simulates the policy, yielding (start, end, process index, process) per slice.
+
+        ``complete(process)`` is called once a process has finished and all
+        of its results are set.
+        """
         pass
-        
+
+    def _arrival_order(self) -> List[Tuple[int, Process]]:
+        """Returns (input index, process) pairs sorted by arrival time"""
+        return sorted(enumerate(self.processes), key=lambda item: item[1].arrival_time)
+
+    def _arrival_stream(self) -> Iterator[Tuple[int, Process]]:
+        """Yields (tie-break index, process) pairs in arrival order.
+
+        Sized inputs are sorted first unless they are flagged
+        ``arrival_sorted``. Any other iterable is consumed lazily and must
+        already be sorted by arrival, so a trace can be scheduled straight
+        from a streaming reader without loading it all.
+        """
+        if getattr(self.processes, 'arrival_sorted', False):
+            return enumerate(self.processes)
+        if hasattr(self.processes, '__len__'):
+            return iter(self._arrival_order())
+        return _checked_arrivals(self.processes)
+
 class FCFSScheduler(Scheduler):
-    def schedule(self) -> List[Tuple[int, Process]]:
-        timeline = []
-        sorted_processes = sorted(self.processes, key=lambda p: p.arrival_time)
+    def _slices(self, complete) -> Iterator[Tuple[int, int, int, Process]]:
         current_time = 0
         
-        for process in sorted_processes:
+        for index, process in self._arrival_stream():
             if current_time < process.arrival_time:
                 current_time = process.arrival_time
             
             process.start_time = current_time
             process.waiting_time = current_time - process.arrival_time
-            timeline.append((current_time, process))
+            yield current_time, current_time + process.burst_time, index, process
             
             current_time += process.burst_time
             process.completion_time = current_time
-            
-        return timeline
+            complete(process)
 
-class SJFScheduler(Scheduler):
-    def schedule(self) -> List[Tuple[int, Process]]:
-        timeline = []
-        remaining_processes = [(p, p.burst_time) for p in self.processes]
+class NonPreemptiveScheduler(Scheduler):
+    """Shared discrete-event core for non-preemptive policies.
+
+    Processes are taken in arrival order from ``_arrival_stream`` into a
+    min-heap ordered by ``_key``, so a full run costs O(n log n).
+    """
+
+    @abstractmethod
+    def _key(self, process: Process) -> tuple:
+        """Returns the ready-queue ordering key (smaller runs first)"""
+        pass
+
+    def _slices(self, complete) -> Iterator[Tuple[int, int, int, Process]]:
+        heappush, heappop = self._heappush, self._heappop
+        arrivals = self._arrival_stream()
+        upcoming = next(arrivals, None)
+        ready = []
         current_time = 0
-        
-        while remaining_processes:
-            # Find ready processes
-            ready_processes = [
-                (p, rt) for p, rt in remaining_processes 
-                if p.arrival_time <= current_time
-            ]
-            
-            if not ready_processes:
+
+        while upcoming is not None or ready:
+            # Admit everything that has arrived by now
+            while upcoming is not None and upcoming[1].arrival_time <= current_time:
+                index, process = upcoming
+                heappush(ready, (self._key(process), index, process))
+                upcoming = next(arrivals, None)
+
+            if not ready:
                 # Jump to next arrival time
-                current_time = min(p.arrival_time for p, _ in remaining_processes)
+                current_time = upcoming[1].arrival_time
                 continue
-            
-            # Select process with shortest remaining time
-            process, remaining_time = min(ready_processes, key=lambda x: (x[1], x[0].pid))
-            
-            # Update process state
-            if process.start_time is None:
-                process.start_time = current_time
-                process.waiting_time = current_time - process.arrival_time
-            
-            timeline.append((current_time, process))
-            current_time += remaining_time
-            
-            # Remove completed process
-            remaining_processes.remove((process, remaining_time))
+
+            _, index, process = heappop(ready)
+
+            process.start_time = current_time
+            process.waiting_time = current_time - process.arrival_time
+            yield current_time, current_time + process.burst_time, index, process
+
+            current_time += process.burst_time
             process.completion_time = current_time
-            # Update waiting time to include any gaps between executions
-            if process.waiting_time is None:
-                process.waiting_time = 0
-            process.waiting_time = process.completion_time - process.arrival_time - process.burst_time
-            
-        return timeline
+            complete(process)
+
+class SJFScheduler(NonPreemptiveScheduler):
+    def _key(self, process: Process) -> tuple:
+        # Shortest burst first, ties broken by PID
+        return (process.burst_time, process.pid)
 
 class RoundRobinScheduler(Scheduler):
     def __init__(self, time_quantum=2):
         super().__init__()
         self.time_quantum = time_quantum
         
-    def schedule(self) -> List[Tuple[int, Process]]:
-        timeline = []
-        remaining_processes = [(p, p.burst_time) for p in self.processes]
+    def _slices(self, complete) -> Iterator[Tuple[int, int, int, Process]]:
+        arrivals = self._arrival_stream()
+        upcoming = next(arrivals, None)
+        # Ready queue entries are [index, process, remaining_time, last_ran_at]
+        ready = deque()
         current_time = 0
-        
-        while remaining_processes:
-            # Find ready processes
-            ready_processes = [
-                (p, rt) for p, rt in remaining_processes 
-                if p.arrival_time <= current_time
-            ]
-            
-            if not ready_processes:
+
+        def admit_arrivals():
+            nonlocal upcoming
+            while upcoming is not None and upcoming[1].arrival_time <= current_time:
+                index, process = upcoming
+                ready.append([index, process, process.burst_time, process.arrival_time])
+                upcoming = next(arrivals, None)
+
+        while upcoming is not None or ready:
+            admit_arrivals()
+
+            if not ready:
                 # Jump to next arrival time
-                current_time = min(p.arrival_time for p, _ in remaining_processes)
+                current_time = upcoming[1].arrival_time
                 continue
-            
-            process, remaining_time = ready_processes[0]
-            
+
+            entry = ready.popleft()
+            index, process, remaining_time, last_ran_at = entry
+
             # Set start time if first execution
-            if process.start_time is None:
+            if remaining_time == process.burst_time:
                 process.start_time = current_time
-                process.waiting_time = current_time - process.arrival_time
-            else:
-                # Add waiting time since last execution
-                last_execution = max(t for t, p in timeline if p == process)
-                process.waiting_time += current_time - last_execution - self.time_quantum
-            
-            timeline.append((current_time, process))
-            
+                process.waiting_time = 0
+            # Add waiting time since the process last left the CPU
+            process.waiting_time += current_time - last_ran_at
+
             # Execute for time quantum or remaining time
             execution_time = min(self.time_quantum, remaining_time)
+            yield current_time, current_time + execution_time, index, process
             current_time += execution_time
             remaining_time -= execution_time
-            
-            # Update process state
-            remaining_processes.remove((process, remaining_time + execution_time))
+
             if remaining_time > 0:
-                remaining_processes.append((process, remaining_time))
-                # Move to the end of the queue
-                remaining_processes = remaining_processes[1:] + [remaining_processes[0]]
+                # Processes that arrived during this slice queue ahead of it
+                admit_arrivals()
+                entry[2] = remaining_time
+                entry[3] = current_time
+                ready.append(entry)
             else:
                 process.completion_time = current_time
-                # Final waiting time calculation
-                process.waiting_time = process.completion_time - process.arrival_time - process.burst_time
-            
-        return timeline
+                complete(process)
 
-class PriorityScheduler(Scheduler):
-    def schedule(self) -> List[Tuple[int, Process]]:
-        timeline = []
-        remaining_processes = self.processes.copy()
+class MLFQScheduler(Scheduler):
+    """Multilevel feedback queue.
+
+    New processes enter level 0. A process that uses up its level's quantum is
+    demoted one level; every ``boost_interval`` time units all waiting
+    processes are moved back to level 0. Levels are deques and a bitmask of
+    non-empty levels picks the next one in O(1) regardless of level count.
+    """
+
+    def __init__(self, level_quanta=(2, 4, 8), boost_interval=None):
+        super().__init__()
+        if not level_quanta or any(q < 1 for q in level_quanta):
+            raise ValueError("Each level needs a time quantum of at least 1")
+        if boost_interval is not None and boost_interval < 1:
+            raise ValueError("Boost interval must be positive")
+        self.level_quanta = list(level_quanta)
+        self.boost_interval = boost_interval
+
+    def _slices(self, complete) -> Iterator[Tuple[int, int, int, Process]]:
+        arrivals = self._arrival_stream()
+        upcoming = next(arrivals, None)
+        lowest = len(self.level_quanta) - 1
+        # Queue entries are [index, process, remaining_time, last_ran_at]
+        levels = [deque() for _ in self.level_quanta]
+        non_empty = 0
         current_time = 0
-        
-        while remaining_processes:
-            # Find ready processes
-            ready_processes = [
-                p for p in remaining_processes 
-                if p.arrival_time <= current_time
-            ]
-            
-            if not ready_processes:
+        next_boost = self.boost_interval
+
+        def admit_arrivals():
+            nonlocal upcoming, non_empty
+            while upcoming is not None and upcoming[1].arrival_time <= current_time:
+                index, process = upcoming
+                levels[0].append([index, process, process.burst_time, process.arrival_time])
+                non_empty |= 1
+                upcoming = next(arrivals, None)
+
+        while upcoming is not None or non_empty:
+            admit_arrivals()
+
+            if next_boost is not None and current_time >= next_boost:
+                # Priority boost: everything waiting goes back to the top level
+                for level in range(1, len(levels)):
+                    levels[0].extend(levels[level])
+                    levels[level].clear()
+                if levels[0]:
+                    non_empty = 1
+                next_boost = (current_time // self.boost_interval + 1) * self.boost_interval
+
+            if not non_empty:
                 # Jump to next arrival time
-                current_time = min(p.arrival_time for p in remaining_processes)
+                current_time = upcoming[1].arrival_time
                 continue
-            
-            # Select process with highest priority (lower number = higher priority)
-            # Break ties with arrival time and PID
-            process = min(ready_processes, 
-                        key=lambda p: (p.priority, p.arrival_time, p.pid))
-            remaining_processes.remove(process)
-            
-            process.start_time = current_time
-            process.waiting_time = current_time - process.arrival_time
-            timeline.append((current_time, process))
-            
-            current_time += process.burst_time
+
+            # Lowest set bit is the highest-priority non-empty level
+            level = (non_empty & -non_empty).bit_length() - 1
+            queue = levels[level]
+            entry = queue.popleft()
+            if not queue:
+                non_empty &= ~(1 << level)
+            index, process, remaining_time, last_ran_at = entry
+
+            if remaining_time == process.burst_time:
+                process.start_time = current_time
+                process.waiting_time = 0
+            process.waiting_time += current_time - last_ran_at
+
+            execution_time = min(self.level_quanta[level], remaining_time)
+            yield current_time, current_time + execution_time, index, process
+            current_time += execution_time
+            remaining_time -= execution_time
+
+            if remaining_time > 0:
+                # Used its whole quantum: demote after this slice's arrivals
+                admit_arrivals()
+                demoted = min(level + 1, lowest)
+                entry[2] = remaining_time
+                entry[3] = current_time
+                levels[demoted].append(entry)
+                non_empty |= 1 << demoted
+            else:
+                process.completion_time = current_time
+                complete(process)
+
+class PriorityScheduler(NonPreemptiveScheduler):
+    """Non-preemptive priority scheduling with optional aging.
+
+    With aging, a waiting process's effective priority improves by
+    ``aging_rate`` per time unit: ``priority - aging_rate * (now - arrival)``.
+    The ``aging_rate * now`` term is shared by every waiting process, so the
+    ready heap can be keyed on ``priority + aging_rate * arrival`` once at
+    admission instead of re-prioritizing everyone on each dispatch.
+    """
+
+    def __init__(self, aging_rate=0.0):
+        super().__init__()
+        if aging_rate < 0:
+            raise ValueError("Aging rate cannot be negative")
+        self.aging_rate = aging_rate
+
+    def _key(self, process: Process) -> tuple:
+        # Lower number = higher priority, ties broken by arrival time and PID
+        return (process.priority + self.aging_rate * process.arrival_time,
+                process.arrival_time, process.pid)
+
+class PreemptiveScheduler(Scheduler):
+    """Shared event loop for preemptive policies.
+
+    The running process is only re-evaluated at arrival events: it runs until
+    it completes or the next process arrives, whichever comes first. With a
+    min-heap ready queue this stays O(n log n) regardless of burst lengths.
+    """
+
+    @abstractmethod
+    def _key(self, process: Process, remaining_time: int) -> tuple:
+        """Returns the ready-queue ordering key (smaller runs first)"""
+        pass
+
+    def _slices(self, complete) -> Iterator[Tuple[int, int, int, Process]]:
+        heappush, heappop = self._heappush, self._heappop
+        arrivals = self._arrival_stream()
+        upcoming = next(arrivals, None)
+        # Ready heap entries are (key, tie-break index, process, remaining_time)
+        ready = []
+        current_time = 0
+        running = None
+
+        while upcoming is not None or ready or running:
+            while upcoming is not None and upcoming[1].arrival_time <= current_time:
+                index, process = upcoming
+                heappush(ready, (self._key(process, process.burst_time), index,
+                                 process, process.burst_time))
+                upcoming = next(arrivals, None)
+
+            if running is not None:
+                # An arrival preempts only if it strictly outranks the running process
+                index, process = running
+                key = self._key(process, remaining_time)
+                if ready and ready[0][:2] < (key, index):
+                    yield slice_start, current_time, index, process
+                    heappush(ready, (key, index, process, remaining_time))
+                    running = None
+
+            if running is None:
+                if not ready:
+                    # Jump to next arrival time
+                    current_time = upcoming[1].arrival_time
+                    continue
+
+                _, index, process, remaining_time = heappop(ready)
+                if remaining_time == process.burst_time:
+                    process.start_time = current_time
+                slice_start = current_time
+                running = (index, process)
+
+            finish_time = current_time + remaining_time
+            if upcoming is not None and upcoming[1].arrival_time < finish_time:
+                # Run up to the next arrival, then re-evaluate
+                next_arrival = upcoming[1].arrival_time
+                remaining_time -= next_arrival - current_time
+                current_time = next_arrival
+                continue
+
+            yield slice_start, finish_time, index, process
+            current_time = finish_time
             process.completion_time = current_time
-            
-        return timeline
+            process.waiting_time = current_time - process.arrival_time - process.burst_time
+            complete(process)
+            running = None
+
+class SRTFScheduler(PreemptiveScheduler):
+    def _key(self, process: Process, remaining_time: int) -> tuple:
+        # Shortest remaining time first, ties broken by arrival time and PID
+        return (remaining_time, process.arrival_time, process.pid)
+
+class PreemptivePriorityScheduler(PreemptiveScheduler):
+    def _key(self, process: Process, remaining_time: int) -> tuple:
+        # Lower number = higher priority, ties broken by arrival time and PID
+        return (process.priority, process.arrival_time, process.pid)
+
+class MultiCoreScheduler(Scheduler):
+    """Simulates ``num_cores`` CPUs sharing one workload.
+
+    Cores are driven by an event heap of core-free times, so cost scales with
+    the number of dispatches rather than cores x time. In ``global`` mode all
+    cores pull from one ready queue; in ``per-core`` mode arrivals are spread
+    round-robin over per-core queues, preempted RR slices return to the core
+    that ran them, and an idle core steals from the longest queue, found in
+    O(log cores) through a heap of queue lengths.
+
+    Each core's slices are kept in ``core_timelines`` unless
+    ``record_core_timelines`` is False; ``core_busy_times`` is always kept.
+    """
+
+    POLICIES = ('FCFS', 'SJF', 'RR', 'Priority')
+    QUEUE_MODES = ('global', 'per-core')
+
+    def __init__(self, num_cores=2, policy='FCFS', time_quantum=2, queue_mode='global'):
+        super().__init__()
+        if num_cores < 1:
+            raise ValueError("Number of cores must be at least 1")
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unsupported multi-core policy: {policy}")
+        if queue_mode not in self.QUEUE_MODES:
+            raise ValueError(f"Unsupported queue mode: {queue_mode}")
+        self.num_cores = num_cores
+        self.policy = policy
+        self.time_quantum = time_quantum
+        self.queue_mode = queue_mode
+        self.core_timelines: List[Timeline] = []
+        self.core_busy_times: List[int] = []
+        self.record_core_timelines = True
+
+    def _key(self, process: Process, index: int, ready_time: int, sequence: int) -> tuple:
+        if self.policy == 'SJF':
+            return (process.burst_time, process.pid, index)
+        if self.policy == 'Priority':
+            return (process.priority, process.arrival_time, process.pid, index)
+        # FCFS and RR serve in order of becoming ready
+        return (ready_time, sequence)
+
+    def _slices(self, complete) -> Iterator[Tuple[int, int, int, Process]]:
+        heappush, heappop = self._heappush, self._heappop
+        arrivals = self._arrival_stream()
+        upcoming = next(arrivals, None)
+        per_core = self.queue_mode == 'per-core'
+        # Ready heap entries are (key, index, process, remaining_time)
+        queues = [[] for _ in range(self.num_cores if per_core else 1)]
+        # Per-core mode: (-queue length, core) pushed on every length change.
+        # Entries whose length is outdated are dropped when they reach the top.
+        loads = []
+        # Slices that will be ready again: (ready_time, sequence, core, index, process, remaining_time)
+        requeued = []
+        # Busy cores wait on an event heap of (free_time, core); idle cores are
+        # parked until new work shows up instead of polling every event
+        cores = []
+        idle = list(range(self.num_cores))
+        self.core_timelines = ([Timeline() for _ in range(self.num_cores)]
+                               if self.record_core_timelines else [])
+        core_timelines = self.core_timelines
+        self.core_busy_times = [0] * self.num_cores
+        sequence = 0
+        ready_count = 0
+        current_time = 0
+
+        while True:
+            next_work = None
+            if upcoming is not None:
+                next_work = upcoming[1].arrival_time
+            if requeued and (next_work is None or requeued[0][0] < next_work):
+                next_work = requeued[0][0]
+
+            if idle and ready_count:
+                core = heapq.heappop(idle)
+            elif cores and (not idle or next_work is None or cores[0][0] <= next_work):
+                current_time, core = heapq.heappop(cores)
+            elif idle and next_work is not None:
+                current_time = next_work
+                core = heapq.heappop(idle)
+            else:
+                break
+
+            # Admit arrivals and returning slices that are ready by now
+            while upcoming is not None and upcoming[1].arrival_time <= current_time:
+                index, process = upcoming
+                owner = sequence % len(queues)
+                queue = queues[owner]
+                heappush(queue, (self._key(process, index, process.arrival_time, sequence),
+                                 index, process, process.burst_time))
+                if per_core:
+                    heapq.heappush(loads, (-len(queue), owner))
+                sequence += 1
+                ready_count += 1
+                upcoming = next(arrivals, None)
+            while requeued and requeued[0][0] <= current_time:
+                ready_time, _, owner, index, process, remaining_time = heapq.heappop(requeued)
+                queue = queues[owner if per_core else 0]
+                heappush(queue, (self._key(process, index, ready_time, sequence),
+                                 index, process, remaining_time))
+                if per_core:
+                    heapq.heappush(loads, (-len(queue), owner))
+                sequence += 1
+                ready_count += 1
+
+            if not ready_count:
+                heapq.heappush(idle, core)
+                continue
+
+            owner = core if per_core else 0
+            queue = queues[owner]
+            if not queue:
+                # Steal from the most loaded core, the lowest-numbered on ties
+                while -loads[0][0] != len(queues[loads[0][1]]):
+                    heapq.heappop(loads)
+                owner = loads[0][1]
+                queue = queues[owner]
+
+            _, index, process, remaining_time = heappop(queue)
+            ready_count -= 1
+            if per_core:
+                if queue:
+                    heapq.heappush(loads, (-len(queue), owner))
+                if len(loads) > 4 * len(queues):
+                    # Keep outdated entries from piling up between steals
+                    loads = [(-len(queue), owner) for owner, queue in enumerate(queues) if queue]
+                    heapq.heapify(loads)
+            if remaining_time == process.burst_time:
+                process.start_time = current_time
+
+            execution_time = remaining_time
+            if self.policy == 'RR':
+                execution_time = min(self.time_quantum, remaining_time)
+            remaining_time -= execution_time
+            end_time = current_time + execution_time
+
+            yield current_time, end_time, index, process
+            if core_timelines:
+                core_timelines[core].append(current_time, end_time, index)
+            self.core_busy_times[core] += execution_time
+
+            if remaining_time > 0:
+                heapq.heappush(requeued, (end_time, sequence, core, index, process, remaining_time))
+                sequence += 1
+            else:
+                process.completion_time = end_time
+                process.waiting_time = end_time - process.arrival_time - process.burst_time
+                complete(process)
+            heapq.heappush(cores, (end_time, core))
+
+class CFSScheduler(Scheduler):
+    """Linux CFS-like fair scheduler.
+
+    ``Process.priority`` is treated as a nice value (-20..19) and mapped to
+    the kernel's load weights. Each dispatch runs the process with the
+    smallest vruntime for its share of ``target_latency``, but never less
+    than ``min_granularity``, and charges it ``exec_time * 1024 / weight``
+    of vruntime. Runnable processes sit in a min-heap keyed on vruntime; the
+    running process is popped and re-inserted, so picks are O(log n).
+    """
+
+    NICE_0_LOAD = 1024
+    # sched_prio_to_weight from the Linux kernel, nice -20 .. 19
+    PRIO_TO_WEIGHT = (
+        88761, 71755, 56483, 46273, 36291,
+        29154, 23254, 18705, 14949, 11916,
+        9548, 7620, 6100, 4904, 3906,
+        3121, 2501, 1991, 1586, 1277,
+        1024, 820, 655, 526, 423,
+        335, 272, 215, 172, 137,
+        110, 87, 70, 56, 45,
+        36, 29, 23, 18, 15,
+    )
+
+    def __init__(self, target_latency=8, min_granularity=1):
+        super().__init__()
+        if min_granularity < 1 or target_latency < min_granularity:
+            raise ValueError("Target latency must be at least the minimum granularity (>= 1)")
+        self.target_latency = target_latency
+        self.min_granularity = min_granularity
+
+    def _weight(self, process: Process) -> int:
+        nice = max(-20, min(19, process.priority))
+        return self.PRIO_TO_WEIGHT[nice + 20]
+
+    def _slices(self, complete) -> Iterator[Tuple[int, int, int, Process]]:
+        heappush, heappop = self._heappush, self._heappop
+        arrivals = self._arrival_stream()
+        upcoming = next(arrivals, None)
+        # Runnable heap entries are (vruntime, input index, process, remaining_time)
+        runnable = []
+        total_weight = 0
+        min_vruntime = 0.0
+        current_time = 0
+
+        def admit_arrivals():
+            nonlocal upcoming, total_weight
+            while upcoming is not None and upcoming[1].arrival_time <= current_time:
+                index, process = upcoming
+                # New processes start at the queue's min_vruntime so they neither
+                # starve nor monopolize the CPU
+                heappush(runnable, (min_vruntime, index, process, process.burst_time))
+                total_weight += self._weight(process)
+                upcoming = next(arrivals, None)
+
+        while upcoming is not None or runnable:
+            admit_arrivals()
+
+            if not runnable:
+                # Jump to next arrival time
+                current_time = upcoming[1].arrival_time
+                continue
+
+            vruntime, index, process, remaining_time = heappop(runnable)
+            min_vruntime = max(min_vruntime, vruntime)
+            weight = self._weight(process)
+
+            if remaining_time == process.burst_time:
+                process.start_time = current_time
+
+            time_slice = max(self.min_granularity, self.target_latency * weight // total_weight)
+            execution_time = min(time_slice, remaining_time)
+            yield current_time, current_time + execution_time, index, process
+            current_time += execution_time
+            remaining_time -= execution_time
+            vruntime += execution_time * self.NICE_0_LOAD / weight
+
+            if remaining_time > 0:
+                admit_arrivals()
+                heappush(runnable, (vruntime, index, process, remaining_time))
+            else:
+                process.completion_time = current_time
+                process.waiting_time = current_time - process.arrival_time - process.burst_time
+                complete(process)
+                total_weight -= weight
+
+class RealTimeScheduler(PreemptiveScheduler):
+    """Preemptive scheduling of periodic and one-shot real-time tasks.
+
+    A process with a ``period`` is a periodic task: it releases a job every
+    ``period`` time units from its arrival time until ``horizon`` (by default
+    one hyperperiod after the last periodic task's first release). Releases
+    are generated lazily and merged in arrival order, so only one pending
+    release per task is held at a time. Processes without a period are
+    scheduled as a single job. Released jobs are collected in ``jobs`` for
+    metrics unless ``keep_jobs`` is False. With ``max_jobs`` set, task sets
+    that would release more jobs than that before the horizon are rejected
+    with a ``ValueError`` before any job is released.
+    """
+
+    # Cap used by the web API and the CLI: a few large coprime periods have
+    # a hyperperiod of billions
+    MAX_JOBS = 1000000
+
+    def __init__(self, horizon=None, max_jobs=None):
+        super().__init__()
+        self.horizon = horizon
+        self.max_jobs = max_jobs
+        self.jobs: List[Process] = []
+        self.keep_jobs = True
+
+    def hyperperiod(self) -> int:
+        periods = [p.period for p in self.processes if p.period]
+        return math.lcm(*periods) if periods else 0
+
+    def effective_horizon(self) -> int:
+        """Returns ``horizon``, or one hyperperiod after the last first release"""
+        if self.horizon is not None:
+            return self.horizon
+        first_releases = [p.arrival_time for p in self.processes if p.period]
+        return max(first_releases, default=0) + self.hyperperiod()
+
+    def job_count(self, horizon=None) -> int:
+        """Returns how many jobs the task set releases, without releasing them"""
+        if horizon is None:
+            horizon = self.effective_horizon()
+        count = 0
+        for task in self.processes:
+            if not task.period:
+                count += 1
+            elif task.arrival_time < horizon:
+                count += -(-(horizon - task.arrival_time) // task.period)
+        return count
+
+    def _releases(self, task: Process, horizon: int) -> Iterator[Process]:
+        if not task.period:
+            yield task
+            return
+        number = 0
+        release_time = task.arrival_time
+        while release_time < horizon:
+            yield task.release_job(number, release_time)
+            number += 1
+            release_time += task.period
+
+    def _arrival_stream(self) -> Iterator[Tuple[int, Process]]:
+        if not hasattr(self.processes, '__len__'):
+            # The horizon depends on every task's period
+            raise ValueError("Real-time schedulers need the whole task set, not a stream")
+        self.jobs = []
+        horizon = self.effective_horizon()
+        if self.max_jobs is not None and self.job_count(horizon) > self.max_jobs:
+            raise ValueError(f"Task set releases more than {self.max_jobs} jobs before "
+                             f"time {horizon}; choose a shorter horizon")
+        releases = heapq.merge(*(self._releases(task, horizon) for task in self.processes),
+                               key=lambda job: job.arrival_time)
+        if not self.keep_jobs:
+            yield from enumerate(releases)
+            return
+        for index, job in enumerate(releases):
+            self.jobs.append(job)
+            yield index, job
+
+class EDFScheduler(RealTimeScheduler):
+    def _key(self, process: Process, remaining_time: int) -> tuple:
+        # Earliest absolute deadline first; jobs without a deadline run last
+        deadline = process.absolute_deadline
+        return (math.inf if deadline is None else deadline, process.arrival_time, process.pid)
+
+class RateMonotonicScheduler(RealTimeScheduler):
+    def _key(self, process: Process, remaining_time: int) -> tuple:
+        # Shorter period = higher static priority; aperiodic jobs run last
+        period = process.period
+        return (period if period else math.inf, process.arrival_time, process.pid)
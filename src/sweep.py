@@ -0,0 +1,192 @@
+"""Parallel parameter sweeps.
+
+Runs every combination of algorithm x time quantum x workload over a
+``ProcessPoolExecutor`` and aggregates the results into one table per
+configuration. Workloads are trace files and seeded random workloads; they
+are handed to each worker once through the pool initializer, so tasks only
+carry a (workload, algorithm, quantum) triple and a metrics row back. Binary
+``.trace`` files travel as paths and every worker maps the file itself, so
+they share its pages instead of each holding a pickled copy.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from .cli import ALGORITHMS, SUMMARY_FIELDS, load_trace, positive_int, run
+from .utils.process_io import ProcessIO, ProcessIOError
+
+# Only these algorithms take a time quantum; others run once per workload
+QUANTUM_ALGORITHMS = ('RR', 'MLFQ')
+# Metrics where larger is better; everything else is minimized
+MAXIMIZED_METRICS = ('cpu_utilization', 'throughput')
+
+# Workloads of the current worker process, set by _init_worker
+_workloads = {}
+
+def _init_worker(workloads):
+    global _workloads
+    # Paths stand for binary traces to map in this process
+    _workloads = {name: ProcessIO.load_binary(workload) if isinstance(workload, str) else workload
+                  for name, workload in workloads.items()}
+
+def _run_config(config):
+    workload, algorithm, quantum = config
+    options = argparse.Namespace(quantum=quantum or 2, aging_rate=0.0, levels=None,
+                                 boost_interval=None, horizon=None, cores=1,
+                                 core_queue='global')
+    row = run(workload, _workloads[workload], algorithm, options)
+    # Ship back the metrics only
+    del row['_processes'], row['_timeline']
+    row['quantum'] = quantum
+    return row
+
+def build_grid(workload_names, algorithms, quanta):
+    """Returns the (workload, algorithm, quantum) triples of a sweep"""
+    grid = []
+    for workload in workload_names:
+        for algorithm in algorithms:
+            for quantum in (quanta if algorithm in QUANTUM_ALGORITHMS else [None]):
+                grid.append((workload, algorithm, quantum))
+    return grid
+
+def run_sweep(workloads, algorithms, quanta, workers=None):
+    """Runs the full grid over ``workloads`` (a name -> processes dict).
+
+    Returns one metrics row per run in grid order. ``workers=1`` runs in
+    this process, which is also what an empty pool would cost.
+    """
+    grid = build_grid(list(workloads), algorithms, quanta)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(grid) == 1:
+        _init_worker(workloads)
+        return [_run_config(config) for config in grid]
+
+    # A few chunks per worker keeps IPC low while still balancing uneven traces
+    chunksize = max(1, len(grid) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(workloads,)) as executor:
+        return list(executor.map(_run_config, grid, chunksize=chunksize))
+
+def aggregate(rows, metric='average_waiting_time'):
+    """Averages runs per (algorithm, quantum), best configuration first"""
+    groups = {}
+    for row in rows:
+        groups.setdefault((row['algorithm'], row['quantum']), []).append(row)
+
+    table = []
+    for (algorithm, quantum), runs in groups.items():
+        entry = {'algorithm': algorithm, 'quantum': quantum, 'runs': len(runs)}
+        fields = []
+        for run_row in runs:
+            fields.extend(key for key, value in run_row.items()
+                          if isinstance(value, (int, float)) and key not in fields
+                          and key not in ('quantum', 'processes'))
+        for field in fields:
+            values = [run_row[field] for run_row in runs if field in run_row]
+            entry[field] = sum(values) / len(values)
+        table.append(entry)
+
+    if table and metric not in table[0]:
+        raise ValueError(f"Unknown metric: {metric}")
+    table.sort(key=lambda entry: entry[metric], reverse=metric in MAXIMIZED_METRICS)
+    for position, entry in enumerate(table):
+        entry['best'] = position == 0
+    return table
+
+def load_workloads(traces, seeds, count):
+    workloads = {}
+    for trace in traces:
+        if os.path.splitext(trace)[1].lower() == '.trace' and not ProcessIO.binary_has_real_time(trace):
+            workloads[trace] = trace
+        else:
+            workloads[trace] = load_trace(trace)
+    for seed in seeds:
+        workloads[f"random-{seed}"] = ProcessIO.generate_random_processes(count, seed=seed)
+    return workloads
+
+def write_text(table, metric, out):
+    columns = ['algorithm', 'quantum', 'runs'] + list(SUMMARY_FIELDS)
+    if metric not in columns:
+        columns.append(metric)
+    cells = []
+    for entry in table:
+        line = []
+        for column in columns:
+            value = entry.get(column)
+            line.append('-' if value is None else
+                        f"{value:.2f}" if isinstance(value, float) else str(value))
+        cells.append(line)
+    widths = [max([len(column)] + [len(line[i]) for line in cells])
+              for i, column in enumerate(columns)]
+
+    out.write("  " + "  ".join(c.ljust(w) for c, w in zip(columns, widths)) + "\n")
+    for entry, line in zip(table, cells):
+        marker = "* " if entry['best'] else "  "
+        out.write(marker + "  ".join(c.ljust(w) for c, w in zip(line, widths)) + "\n")
+    if table:
+        best = table[0]
+        quantum = f" (quantum {best['quantum']})" if best['quantum'] is not None else ""
+        out.write(f"\nBest by {metric}: {best['algorithm']}{quantum}\n")
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='cli.py sweep',
+        description="Sweep algorithms and time quanta over many workloads in parallel.")
+    parser.add_argument('traces', nargs='*', metavar='TRACE',
+                        help="process trace in ProcessIO JSON, JSON Lines, CSV or binary (.trace) format")
+    parser.add_argument('-a', '--algorithms', nargs='+', default=['FCFS', 'SJF', 'RR', 'Priority'],
+                        metavar='ALGORITHM', choices=list(ALGORITHMS),
+                        help="algorithms to compare (default: FCFS SJF RR Priority)")
+    parser.add_argument('-q', '--quanta', type=positive_int, nargs='+', default=[2], metavar='QUANTUM',
+                        help=f"time quanta for {' and '.join(QUANTUM_ALGORITHMS)} (default: 2)")
+    parser.add_argument('--seeds', type=int, nargs='+', default=[], metavar='SEED',
+                        help="also sweep one random workload per seed")
+    parser.add_argument('--count', type=positive_int, default=50,
+                        help="processes per random workload (default: 50)")
+    parser.add_argument('-j', '--workers', type=positive_int,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument('-m', '--metric', default='average_waiting_time',
+                        help="metric that picks the best configuration (default: average_waiting_time)")
+    parser.add_argument('-f', '--format', choices=('text', 'json', 'csv'), default='text',
+                        help="output format (default: text)")
+    parser.add_argument('-o', '--output', metavar='FILE',
+                        help="write results to FILE instead of stdout")
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    options = parser.parse_args(argv)
+    if not options.traces and not options.seeds:
+        parser.error("give at least one trace or --seeds")
+
+    try:
+        workloads = load_workloads(options.traces, options.seeds, options.count)
+        rows = run_sweep(workloads, options.algorithms, options.quanta, options.workers)
+        table = aggregate(rows, options.metric)
+
+        out = open(options.output, 'w', newline='') if options.output else sys.stdout
+        try:
+            if options.format == 'json':
+                json.dump({'metric': options.metric, 'configurations': table, 'runs': rows},
+                          out, indent=4)
+                out.write("\n")
+            elif options.format == 'csv':
+                fieldnames = []
+                for entry in table:
+                    fieldnames.extend(key for key in entry if key not in fieldnames)
+                writer = csv.DictWriter(out, fieldnames=fieldnames, lineterminator='\n')
+                writer.writeheader()
+                writer.writerows(table)
+            else:
+                write_text(table, options.metric, out)
+        finally:
+            if out is not sys.stdout:
+                out.close()
+    except (ProcessIOError, ValueError, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return 0
@@ -1,11 +1,12 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
-from ..core.scheduler import FCFSScheduler, SJFScheduler, RoundRobinScheduler, PriorityScheduler
+from ..core.scheduler import (FCFSScheduler, SJFScheduler, RoundRobinScheduler, PriorityScheduler,
+                              SRTFScheduler, PreemptivePriorityScheduler)
 from ..visualization.gantt_chart import GanttChart
-from ..utils.pdf_generator import PDFGenerator
 from ..utils.process_io import ProcessIO
 from ..utils.theme_manager import ThemeManager
 from ..core.metrics import PerformanceMetrics
+from ..core.instrumentation import Instrumentation, NULL_INSTRUMENTATION
 from .process_form import ProcessForm
 import copy
 import os
@@ -20,7 +21,9 @@ class MainWindow(ttk.Frame):
         # Initialize managers
         downloads_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
                                    "CPU Schedule Downloads")
-        self.pdf_generator = PDFGenerator(downloads_dir)
+        # reportlab is only loaded once a report is first downloaded
+        self.downloads_dir = downloads_dir
+        self.pdf_generator = None
         self.theme_manager = ThemeManager()
         self.theme_manager.add_theme_listener(self._apply_theme)  
         self.process_io = ProcessIO()
@@ -68,8 +71,8 @@ class MainWindow(ttk.Frame):
         algo_frame.pack(side=tk.LEFT, padx=5)
         
         self.algorithm = ttk.Combobox(algo_frame, values=[
-            "FCFS", "SJF", "Round Robin", "Priority"
-        ], state="readonly", width=15)
+            "FCFS", "SJF", "SRTF", "Round Robin", "Priority", "Preemptive Priority"
+        ], state="readonly", width=18)
         self.algorithm.set("FCFS")
         self.algorithm.pack(side=tk.LEFT, padx=5)
         
@@ -81,6 +84,14 @@ class MainWindow(ttk.Frame):
         self.time_quantum.insert(0, "2")
         self.time_quantum.pack(side=tk.LEFT, padx=5)
         
+        # Aging rate for Priority
+        aging_frame = ttk.LabelFrame(top_controls, text="Aging Rate", padding="5")
+        aging_frame.pack(side=tk.LEFT, padx=5)
+        
+        self.aging_rate = ttk.Entry(aging_frame, width=5)
+        self.aging_rate.insert(0, "0")
+        self.aging_rate.pack(side=tk.LEFT, padx=5)
+        
         # Theme toggle
         theme_frame = ttk.Frame(top_controls)
         theme_frame.pack(side=tk.RIGHT, padx=5)
@@ -113,6 +124,10 @@ class MainWindow(ttk.Frame):
                   command=self._run_simulation).pack(side=tk.LEFT, padx=2)
         ttk.Button(sim_btn_frame, text="Download Report",
                   command=self._download_report).pack(side=tk.LEFT, padx=2)
+        # Opt-in timing of each simulation phase, shown in the metrics panel
+        self.show_timings = tk.BooleanVar(value=False)
+        ttk.Checkbutton(sim_btn_frame, text="Show Timings",
+                        variable=self.show_timings).pack(side=tk.LEFT, padx=2)
     
     def _setup_process_list(self):
         # Create process list with scrollbar
@@ -240,23 +255,44 @@ class MainWindow(ttk.Frame):
                 messagebox.showerror("Error", str(e))
                 return
         elif algorithm == "Priority":
-            self.scheduler = PriorityScheduler()
-        
+            try:
+                aging_rate = float(self.aging_rate.get())
+                if aging_rate < 0:
+                    raise ValueError("Aging rate cannot be negative")
+                self.scheduler = PriorityScheduler(aging_rate=aging_rate)
+            except ValueError as e:
+                messagebox.showerror("Error", str(e))
+                return
+        elif algorithm == "SRTF":
+            self.scheduler = SRTFScheduler()
+        elif algorithm == "Preemptive Priority":
+            self.scheduler = PreemptivePriorityScheduler()
+        
+        instrumentation = Instrumentation() if self.show_timings.get() else NULL_INSTRUMENTATION
+        if instrumentation.enabled:
+            self.scheduler.instrumentation = instrumentation
+
         # Run scheduling algorithm
         self.scheduler.processes = simulation_processes
         self.current_timeline = self.scheduler.schedule()
         
         # Update visualization
-        self.gantt_chart.update(self.current_timeline)
+        with instrumentation.phase('render'):
+            self.gantt_chart.update(self.current_timeline)
         
         # Calculate and display metrics
-        self.metrics = PerformanceMetrics(simulation_processes, self.current_timeline)
-        metrics_data = self.metrics.get_all_metrics()
+        with instrumentation.phase('metrics'):
+            self.metrics = PerformanceMetrics(simulation_processes, self.current_timeline)
+            metrics_data = self.metrics.get_all_metrics()
         
         # Update metrics display
         self.metrics_text.delete(1.0, tk.END)
         for metric, value in metrics_data.items():
             self.metrics_text.insert(tk.END, f"{metric}: {value}\n")
+        if instrumentation.enabled:
+            self.metrics_text.insert(tk.END, "\nTimings:\n")
+            for line in instrumentation.lines():
+                self.metrics_text.insert(tk.END, f"{line}\n")
         
         # Store simulation results and update process tree
         self.processes = simulation_processes
@@ -268,6 +304,9 @@ class MainWindow(ttk.Frame):
             return
         
         try:
+            if self.pdf_generator is None:
+                from ..utils.pdf_generator import PDFGenerator
+                self.pdf_generator = PDFGenerator(self.downloads_dir)
             metrics_text = self.metrics_text.get(1.0, tk.END)
             filename = self.pdf_generator.generate_report(
                 algorithm=self.algorithm.get(),
@@ -0,0 +1,241 @@
+"""Background jobs on a local process pool.
+
+``JobManager`` runs long simulations in worker processes so request threads
+only submit and poll. There is no broker: each job gets a slot in a small
+shared-memory array where the worker publishes its progress and reads the
+cancellation flag, and finished results are kept in the submitting process
+until their time to live runs out or newer results need their room.
+"""
+
+import multiprocessing
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+QUEUED = 'queued'
+RUNNING = 'running'
+# Cancellation requested, the worker has not stopped yet
+CANCELLING = 'cancelling'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+# Per-slot fields of the shared progress array
+_COMPLETED, _TOTAL, _STARTED, _CANCEL = range(4)
+_FIELDS = 4
+# Total is not known (yet)
+_UNKNOWN = -1
+
+class JobCancelled(Exception):
+    """Raised inside a job whose cancellation was requested"""
+
+class JobProgress:
+    """Worker-side handle passed to every job function as its last argument.
+
+    Set ``total`` once the amount of work is known and call ``advance()`` as
+    it gets done; ``advance()`` raises ``JobCancelled`` once the job has been
+    cancelled, which ends it at the next unit of work. Jobs whose units can
+    be far apart also call ``check()`` every so often in between.
+    """
+
+    def __init__(self, state, slot):
+        self._state = state
+        self._base = slot * _FIELDS
+
+    @property
+    def total(self):
+        total = self._state[self._base + _TOTAL]
+        return None if total == _UNKNOWN else total
+
+    @total.setter
+    def total(self, value):
+        self._state[self._base + _TOTAL] = _UNKNOWN if value is None else value
+
+    def advance(self, amount=1):
+        self._state[self._base + _COMPLETED] += amount
+        self.check()
+
+    def check(self):
+        """Raises ``JobCancelled`` if the job has been cancelled"""
+        if self._state[self._base + _CANCEL]:
+            raise JobCancelled()
+
+# Shared progress array of the current worker process, set by _init_worker
+_state = None
+
+def _init_worker(state):
+    global _state
+    _state = state
+
+def _run(slot, function, args):
+    progress = JobProgress(_state, slot)
+    _state[slot * _FIELDS + _STARTED] = 1
+    if _state[slot * _FIELDS + _CANCEL]:
+        raise JobCancelled()
+    return function(*args, progress)
+
+class _Job:
+    __slots__ = ('id', 'slot', 'future', 'submitted', 'finished', 'progress', 'size')
+
+    def __init__(self, job_id, slot, future):
+        self.id = job_id
+        self.slot = slot
+        self.future = future
+        self.submitted = time.time()
+        self.finished = None
+        # (completed, total) as of the end; live jobs read their slot instead
+        self.progress = None
+        # Bytes of the finished job's result
+        self.size = 0
+
+class JobManager:
+    """Submits, tracks and cancels jobs running on a local process pool.
+
+    At most ``max_jobs`` jobs may be queued or running at once; ``submit``
+    returns None beyond that. Results of finished, failed and cancelled jobs
+    are dropped ``ttl`` seconds after they end, and the oldest ones sooner
+    when the ``bytes`` results held together exceed ``max_result_bytes``
+    (a single result bigger than that is dropped at once). The pool starts
+    on the first submission, so a manager created at import time forks
+    nothing until it is used. Jobs live in the process that submitted them.
+    """
+
+    def __init__(self, workers=None, max_jobs=64, ttl=600.0, max_result_bytes=256 << 20):
+        self.workers = workers
+        self.max_jobs = max_jobs
+        self.ttl = ttl
+        self.max_result_bytes = max_result_bytes
+        self._jobs = {}
+        self._result_bytes = 0
+        self._free_slots = list(range(max_jobs))
+        self._state = None
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _pool(self):
+        if self._executor is None:
+            self._state = multiprocessing.Array('q', self.max_jobs * _FIELDS, lock=False)
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                 initargs=(self._state,))
+        return self._executor
+
+    def submit(self, function, *args):
+        """Queues ``function(*args, progress)``; returns the job id or None when full.
+
+        ``function`` and ``args`` are sent to a worker process, so they must
+        be picklable and the function defined at module level.
+        """
+        with self._lock:
+            self._expire()
+            if not self._free_slots:
+                return None
+            executor = self._pool()
+            slot = self._free_slots.pop()
+            base = slot * _FIELDS
+            for field in range(_FIELDS):
+                self._state[base + field] = 0
+            self._state[base + _TOTAL] = _UNKNOWN
+            job = _Job(uuid.uuid4().hex, slot, executor.submit(_run, slot, function, args))
+            self._jobs[job.id] = job
+        job.future.add_done_callback(lambda future: self._finish(job))
+        return job.id
+
+    def _finish(self, job):
+        future = job.future
+        if not future.cancelled() and future.exception() is None:
+            result = future.result()
+            if isinstance(result, (bytes, bytearray, memoryview)):
+                job.size = len(result)
+        with self._lock:
+            job.finished = time.time()
+            job.progress = self._progress(job.slot)
+            self._free_slots.append(job.slot)
+            self._result_bytes += job.size
+            if self._result_bytes > self.max_result_bytes:
+                # Make room by dropping the oldest finished jobs first
+                finished = sorted((job for job in self._jobs.values() if job.finished is not None),
+                                  key=lambda job: job.finished)
+                for old in finished:
+                    if self._result_bytes <= self.max_result_bytes:
+                        break
+                    self._drop(old)
+
+    def _drop(self, job):
+        # Called with the lock held
+        del self._jobs[job.id]
+        self._result_bytes -= job.size
+
+    def _expire(self):
+        # Called with the lock held
+        deadline = time.time() - self.ttl
+        for job in [job for job in self._jobs.values()
+                    if job.finished is not None and job.finished < deadline]:
+            self._drop(job)
+
+    def _job(self, job_id):
+        with self._lock:
+            self._expire()
+            return self._jobs.get(job_id)
+
+    def _progress(self, slot):
+        base = slot * _FIELDS
+        total = self._state[base + _TOTAL]
+        return self._state[base + _COMPLETED], None if total == _UNKNOWN else total
+
+    def _status_of(self, job):
+        future = job.future
+        if not future.done():
+            base = job.slot * _FIELDS
+            if self._state[base + _CANCEL]:
+                return CANCELLING
+            return RUNNING if self._state[base + _STARTED] else QUEUED
+        if future.cancelled():
+            return CANCELLED
+        error = future.exception()
+        if error is None:
+            return DONE
+        return CANCELLED if isinstance(error, JobCancelled) else FAILED
+
+    def status(self, job_id):
+        """Returns the job's state and progress as a dict, or None if unknown or expired"""
+        job = self._job(job_id)
+        if job is None:
+            return None
+        status = self._status_of(job)
+        info = {'id': job.id, 'status': status, 'submitted': job.submitted, 'finished': job.finished}
+        # Finished jobs have given their slot back to later jobs
+        info['completed'], info['total'] = job.progress or self._progress(job.slot)
+        if status == FAILED:
+            error = job.future.exception()
+            info['error'] = str(error) or type(error).__name__
+        return info
+
+    def result(self, job_id):
+        """Returns a finished job's (status, value); value is None unless status is done.
+
+        Returns None for unknown or expired jobs.
+        """
+        job = self._job(job_id)
+        if job is None:
+            return None
+        status = self._status_of(job)
+        return status, job.future.result() if status == DONE else None
+
+    def cancel(self, job_id):
+        """Cancels a queued job at once and a running one at its next progress update.
+
+        Returns False for unknown or expired jobs.
+        """
+        job = self._job(job_id)
+        if job is None:
+            return False
+        if not job.future.cancel() and not job.future.done():
+            self._state[job.slot * _FIELDS + _CANCEL] = 1
+        return True
+
+    def shutdown(self):
+        """Cancels queued jobs and stops the pool once running jobs end"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
@@ -4,7 +4,6 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 import os
-import matplotlib.pyplot as plt
 from datetime import datetime
 
 class PDFGenerator:
@@ -1,12 +1,46 @@
 import json
 import csv
+import mmap
 import os
+import struct
+import sys
+from array import array
 from ..core.process import Process
+from ..core.process_table import ProcessTable
+
+# Binary trace layout: a 32-byte header followed by one little-endian int64
+# column per field, each ``count`` values long. -1 marks a missing deadline
+# or period. Fixed-width columns can be mapped into memory without parsing.
+BINARY_MAGIC = b'CPUTRACE'
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct('<8sHH4xQ8x')
+BINARY_COLUMNS = ('pid', 'arrival_time', 'burst_time', 'priority', 'deadline', 'period')
+BINARY_ARRIVAL_SORTED = 1
+BINARY_REAL_TIME = 2
 
 class ProcessIOError(Exception):
     pass
 
 class ProcessIO:
+    @staticmethod
+    def _optional_int(value):
+        # Real-time fields are optional: missing, null and empty all mean "none"
+        if value is None or value == '':
+            return None
+        return int(value)
+
+    @staticmethod
+    def _parse_pid(value):
+        # Exports write the display form "P1"; accept it as well as a bare number
+        return int(str(value).strip().lstrip('P'))
+
+    @staticmethod
+    def _ensure_directory(filename):
+        # A bare filename lives in the current directory, which already exists
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
     @staticmethod
     def export_to_json(processes, filename):
         try:
@@ -16,10 +50,12 @@ class ProcessIO:
                     'pid': p.pid,
                     'arrival_time': p.arrival_time,
                     'burst_time': p.burst_time,
-                    'priority': p.priority
+                    'priority': p.priority,
+                    'deadline': p.deadline,
+                    'period': p.period
                 })
             
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            ProcessIO._ensure_directory(filename)
             with open(filename, 'w') as f:
                 json.dump(data, f, indent=4)
         except Exception as e:
@@ -34,13 +70,7 @@ class ProcessIO:
             processes = []
             for p in data:
                 try:
-                    process = Process(
-                        pid=int(p['pid']),
-                        arrival_time=int(p['arrival_time']),
-                        burst_time=int(p['burst_time']),
-                        priority=int(p['priority'])
-                    )
-                    processes.append(process)
+                    processes.append(ProcessIO._process_from_record(p))
                 except (KeyError, ValueError) as e:
                     raise ProcessIOError(f"Invalid process data: {str(e)}")
                     
@@ -53,12 +83,14 @@ class ProcessIO:
     @staticmethod
     def export_to_csv(processes, filename):
         try:
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            ProcessIO._ensure_directory(filename)
             with open(filename, 'w', newline='') as f:
                 writer = csv.writer(f)
-                writer.writerow(['PID', 'Arrival Time', 'Burst Time', 'Priority'])
+                writer.writerow(['PID', 'Arrival Time', 'Burst Time', 'Priority', 'Deadline', 'Period'])
                 for p in processes:
-                    writer.writerow([p.pid, p.arrival_time, p.burst_time, p.priority])
+                    writer.writerow([p.pid, p.arrival_time, p.burst_time, p.priority,
+                                     '' if p.deadline is None else p.deadline,
+                                     '' if p.period is None else p.period])
         except Exception as e:
             raise ProcessIOError(f"Failed to export to CSV: {str(e)}")
                 
@@ -71,10 +103,12 @@ class ProcessIO:
                 for row in reader:
                     try:
                         process = Process(
-                            pid=int(row['PID']),
+                            pid=ProcessIO._parse_pid(row['PID']),
                             arrival_time=int(row['Arrival Time']),
                             burst_time=int(row['Burst Time']),
-                            priority=int(row['Priority'])
+                            priority=int(row['Priority']),
+                            deadline=ProcessIO._optional_int(row.get('Deadline')),
+                            period=ProcessIO._optional_int(row.get('Period'))
                         )
                         processes.append(process)
                     except (KeyError, ValueError) as e:
@@ -87,16 +121,327 @@ class ProcessIO:
             raise ProcessIOError(f"Failed to import from CSV: {str(e)}")
         
     @staticmethod
-    def generate_random_processes(count, max_arrival=20, max_burst=10, max_priority=10):
+    def _process_from_record(record):
+        # One process from a JSON / JSON Lines object
+        return Process(
+            pid=ProcessIO._parse_pid(record['pid']),
+            arrival_time=int(record['arrival_time']),
+            burst_time=int(record['burst_time']),
+            priority=int(record['priority']),
+            deadline=ProcessIO._optional_int(record.get('deadline')),
+            period=ProcessIO._optional_int(record.get('period'))
+        )
+
+    @staticmethod
+    def _csv_rows(filename):
+        """Yields (pid, arrival, burst, priority, deadline, period) per CSV row"""
+        with open(filename, 'r', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+            try:
+                pid, arrival, burst, priority = (header.index(name) for name in
+                                                 ('PID', 'Arrival Time', 'Burst Time', 'Priority'))
+            except ValueError as e:
+                raise ProcessIOError(f"Missing CSV column: {str(e)}")
+            deadline = header.index('Deadline') if 'Deadline' in header else None
+            period = header.index('Period') if 'Period' in header else None
+            optional_int = ProcessIO._optional_int
+            for row in reader:
+                if not row:
+                    continue
+                try:
+                    yield (ProcessIO._parse_pid(row[pid]), int(row[arrival]), int(row[burst]),
+                           int(row[priority]),
+                           optional_int(row[deadline]) if deadline is not None else None,
+                           optional_int(row[period]) if period is not None else None)
+                except (IndexError, ValueError) as e:
+                    raise ProcessIOError(f"Invalid process data in CSV line {reader.line_num}: {str(e)}")
+
+    @staticmethod
+    def iter_csv(filename):
+        """Yields processes from a CSV trace one row at a time.
+
+        Memory stays flat however long the trace is. Assign the iterator to
+        ``Scheduler.processes`` to schedule the trace as it is read; the file
+        must then be sorted by arrival time.
+        """
+        try:
+            for fields in ProcessIO._csv_rows(filename):
+                yield Process(*fields)
+        except ProcessIOError:
+            raise
+        except Exception as e:
+            raise ProcessIOError(f"Failed to read CSV: {str(e)}")
+
+    @staticmethod
+    def iter_json(filename, buffer_size=1 << 20):
+        """Yields processes from a JSON array trace, parsing it incrementally.
+
+        The file is read ``buffer_size`` characters at a time, so only the
+        objects currently in the buffer are held in memory. Anything but
+        whitespace after the closing ``]`` is an error, as with ``json.load``.
+        """
+        decoder = json.JSONDecoder()
+        try:
+            with open(filename, 'r') as f:
+                buffer = ''
+                position = 0
+                # What may come next: '[', the first object or ']', an object
+                # after a comma, the ',' / ']' after an object, or only
+                # whitespace after the closing ']'
+                expected = '['
+                while True:
+                    while position < len(buffer) and buffer[position] in ' \t\r\n':
+                        position += 1
+                    record = None
+                    if position < len(buffer):
+                        char = buffer[position]
+                        if expected == 'end':
+                            raise ProcessIOError("Invalid JSON trace: unexpected data after the closing ']'")
+                        if expected == '[':
+                            if char != '[':
+                                raise ProcessIOError("JSON trace must be an array of processes")
+                            expected = 'first'
+                            position += 1
+                            continue
+                        if expected == 'separator':
+                            if char == ']':
+                                expected = 'end'
+                                position += 1
+                                continue
+                            if char != ',':
+                                raise ProcessIOError("Invalid JSON trace: expected ',' or ']' after a process")
+                            expected = 'object'
+                            position += 1
+                            continue
+                        if char == ']' and expected == 'first':
+                            expected = 'end'
+                            position += 1
+                            continue
+                        if char in ',]':
+                            raise ProcessIOError("Invalid JSON trace: expected a process")
+                        try:
+                            record, position_after = decoder.raw_decode(buffer, position)
+                        except json.JSONDecodeError:
+                            # Most likely an object cut off at the end of the buffer
+                            pass
+                    if record is None:
+                        chunk = f.read(buffer_size)
+                        if not chunk:
+                            if expected == 'end':
+                                return
+                            raise ProcessIOError("Truncated or invalid JSON trace")
+                        buffer = buffer[position:] + chunk
+                        position = 0
+                        continue
+                    try:
+                        yield ProcessIO._process_from_record(record)
+                    except (KeyError, TypeError, ValueError) as e:
+                        raise ProcessIOError(f"Invalid process data: {str(e)}")
+                    position = position_after
+                    expected = 'separator'
+        except ProcessIOError:
+            raise
+        except Exception as e:
+            raise ProcessIOError(f"Failed to read JSON: {str(e)}")
+
+    @staticmethod
+    def export_to_jsonl(processes, filename):
+        """Writes one JSON object per line (JSON Lines)"""
+        try:
+            ProcessIO._ensure_directory(filename)
+            with open(filename, 'w') as f:
+                for p in processes:
+                    json.dump({
+                        'pid': p.pid,
+                        'arrival_time': p.arrival_time,
+                        'burst_time': p.burst_time,
+                        'priority': p.priority,
+                        'deadline': p.deadline,
+                        'period': p.period
+                    }, f)
+                    f.write('\n')
+        except Exception as e:
+            raise ProcessIOError(f"Failed to export to JSON Lines: {str(e)}")
+
+    @staticmethod
+    def iter_jsonl(filename):
+        """Yields processes from a JSON Lines trace, one line at a time"""
+        try:
+            with open(filename, 'r') as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield ProcessIO._process_from_record(json.loads(line))
+                    except (KeyError, TypeError, ValueError) as e:
+                        raise ProcessIOError(f"Invalid process data on line {line_number}: {str(e)}")
+        except ProcessIOError:
+            raise
+        except Exception as e:
+            raise ProcessIOError(f"Failed to read JSON Lines: {str(e)}")
+
+    @staticmethod
+    def import_from_jsonl(filename):
+        return list(ProcessIO.iter_jsonl(filename))
+
+    @staticmethod
+    def export_to_binary(processes, filename):
+        """Writes processes (a list, ``ProcessTable`` or any iterable) as a binary trace.
+
+        The header records whether the trace is sorted by arrival time and
+        whether any process has real-time parameters. Feeding a streaming
+        reader such as ``iter_csv`` converts a trace without ``Process`` lists.
+        """
+        try:
+            columns = [array('q') for _ in BINARY_COLUMNS]
+            if isinstance(processes, ProcessTable):
+                for column, values in zip(columns, (processes.pid, processes.arrival_time,
+                                                    processes.burst_time, processes.priority)):
+                    column.extend(values)
+                columns[4] = array('q', [-1]) * len(processes)
+                columns[5] = array('q', [-1]) * len(processes)
+            else:
+                pid, arrival, burst, priority, deadline, period = (column.append for column in columns)
+                for p in processes:
+                    pid(ProcessIO._parse_pid(p.pid))
+                    arrival(p.arrival_time)
+                    burst(p.burst_time)
+                    priority(p.priority)
+                    deadline(-1 if p.deadline is None else p.deadline)
+                    period(-1 if p.period is None else p.period)
+
+            arrivals = columns[1]
+            flags = 0
+            if all(arrivals[i] <= arrivals[i + 1] for i in range(len(arrivals) - 1)):
+                flags |= BINARY_ARRIVAL_SORTED
+            if any(value != -1 for value in columns[4]) or any(value != -1 for value in columns[5]):
+                flags |= BINARY_REAL_TIME
+
+            ProcessIO._ensure_directory(filename)
+            with open(filename, 'wb') as f:
+                f.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, flags, len(arrivals)))
+                for column in columns:
+                    if sys.byteorder == 'big':
+                        column.byteswap()
+                    f.write(column.tobytes())
+        except ProcessIOError:
+            raise
+        except Exception as e:
+            raise ProcessIOError(f"Failed to export to binary trace: {str(e)}")
+
+    @staticmethod
+    def _map_binary(filename):
+        """Maps a binary trace read-only; returns (flags, columns).
+
+        Columns are int64 ``memoryview`` slices of the mapping, so nothing
+        is copied and processes mapping the same file share its pages. Only
+        big-endian hosts, which cannot use the data in place, get copies.
+        """
+        try:
+            with open(filename, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise ProcessIOError(f"Failed to read binary trace: {str(e)}")
+        if len(mapped) < BINARY_HEADER.size:
+            raise ProcessIOError(f"Not a binary trace: {filename}")
+        magic, version, flags, count = BINARY_HEADER.unpack_from(mapped)
+        if magic != BINARY_MAGIC:
+            raise ProcessIOError(f"Not a binary trace: {filename}")
+        if version != BINARY_VERSION:
+            raise ProcessIOError(f"Unsupported binary trace version {version}: {filename}")
+        size = count * 8
+        if len(mapped) < BINARY_HEADER.size + size * len(BINARY_COLUMNS):
+            raise ProcessIOError(f"Truncated binary trace: {filename}")
+
+        # The views keep the mapping alive; it is unmapped once they are all gone
+        view = memoryview(mapped)
+        columns = []
+        for position in range(len(BINARY_COLUMNS)):
+            offset = BINARY_HEADER.size + position * size
+            column = view[offset:offset + size].cast('q')
+            if sys.byteorder == 'big':
+                column = array('q', column.tobytes())
+                column.byteswap()
+            columns.append(column)
+        return flags, columns
+
+    @staticmethod
+    def load_binary(filename):
+        """Maps a binary trace into a ``ProcessTable`` in constant time.
+
+        The input columns are views of the file, so loading takes the same
+        few milliseconds for ten processes or ten million. Like every
+        ``ProcessTable`` it has no real-time columns; ``binary_has_real_time``
+        tells whether a trace needs ``import_from_binary`` instead.
+        """
+        flags, columns = ProcessIO._map_binary(filename)
+        return ProcessTable.from_buffers(*columns[:4],
+                                         arrival_sorted=bool(flags & BINARY_ARRIVAL_SORTED))
+
+    @staticmethod
+    def binary_has_real_time(filename):
+        flags, _ = ProcessIO._map_binary(filename)
+        return bool(flags & BINARY_REAL_TIME)
+
+    @staticmethod
+    def iter_binary(filename):
+        """Yields ``Process`` objects, with real-time parameters, from a binary trace"""
+        _, columns = ProcessIO._map_binary(filename)
+        for pid, arrival, burst, priority, deadline, period in zip(*columns):
+            yield Process(pid, arrival, burst, priority,
+                          None if deadline == -1 else deadline,
+                          None if period == -1 else period)
+
+    @staticmethod
+    def import_from_binary(filename):
+        return list(ProcessIO.iter_binary(filename))
+
+    @staticmethod
+    def export_timeline_to_csv(slices, filename):
+        """Writes (start, end, process) slices, e.g. from ``Scheduler.iter_schedule()``,
+        one row at a time so the timeline never has to fit in memory"""
+        try:
+            ProcessIO._ensure_directory(filename)
+            with open(filename, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['Start', 'End', 'PID'])
+                for start, end, process in slices:
+                    writer.writerow([start, end, process.pid])
+        except Exception as e:
+            raise ProcessIOError(f"Failed to export timeline to CSV: {str(e)}")
+
+    @staticmethod
+    def export_timeline_to_json(slices, filename):
+        """Streams (start, end, process) slices out as a JSON array"""
+        try:
+            ProcessIO._ensure_directory(filename)
+            with open(filename, 'w') as f:
+                f.write('[')
+                separator = '\n'
+                for start, end, process in slices:
+                    f.write(separator)
+                    json.dump({'start': start, 'end': end, 'pid': process.pid}, f)
+                    separator = ',\n'
+                f.write('\n]\n')
+        except Exception as e:
+            raise ProcessIOError(f"Failed to export timeline to JSON: {str(e)}")
+
+    @staticmethod
+    def generate_random_processes(count, max_arrival=20, max_burst=10, max_priority=10, seed=None):
         try:
             import random
+            # A seed makes the workload reproducible without touching global state
+            rng = random.Random(seed) if seed is not None else random
             processes = []
             for i in range(count):
                 process = Process(
                     pid=i+1,
-                    arrival_time=random.randint(0, max_arrival),
-                    burst_time=random.randint(1, max_burst),
-                    priority=random.randint(0, max_priority)
+                    arrival_time=rng.randint(0, max_arrival),
+                    burst_time=rng.randint(1, max_burst),
+                    priority=rng.randint(0, max_priority)
                 )
                 processes.append(process)
             return processes
@@ -0,0 +1,176 @@
+"""Bounded cache of encoded scheduling results.
+
+Entries are keyed by a content hash of the request (see ``cache_key``) and
+hold the encoded response body, so a hit costs one lookup: no scheduling and
+no JSON encoding. The in-memory tier is an LRU bounded by total bytes. An
+optional sqlite file adds a second tier shared by every process that opens
+the same path, such as all gunicorn workers of one server.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+def cache_key(*parts):
+    """Returns the SHA-256 hex digest of the canonical JSON form of ``parts``.
+
+    Keys are sorted and whitespace dropped, so equal values always give the
+    same key however their dicts were built.
+    """
+    encoded = json.dumps(parts, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+class ResultCache:
+    """LRU cache of ``bytes`` values with byte-size bounds per tier.
+
+    ``max_bytes`` bounds the in-memory tier (0 disables it). ``path`` names
+    an sqlite file for the shared disk tier, bounded by ``max_disk_bytes``;
+    without it only memory is used. Disk errors (e.g. a locked database)
+    count as misses, so the cache never fails a request. Safe to use from
+    several threads.
+    """
+
+    def __init__(self, max_bytes=64 << 20, path=None, max_disk_bytes=1 << 30):
+        self.max_bytes = max_bytes
+        self.path = path
+        self.max_disk_bytes = max_disk_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.counters = dict.fromkeys(('hits', 'misses', 'memory_hits', 'disk_hits', 'stores',
+                                       'evictions', 'disk_evictions', 'disk_errors'), 0)
+        if path:
+            with self._connect() as connection:
+                # Lets readers in other workers proceed while one of them writes
+                connection.execute('PRAGMA journal_mode=WAL')
+                connection.execute('CREATE TABLE IF NOT EXISTS results ('
+                                   'key TEXT PRIMARY KEY, value BLOB NOT NULL, '
+                                   'size INTEGER NOT NULL, accessed REAL NOT NULL)')
+                connection.execute('CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)')
+
+    @contextmanager
+    def _connect(self):
+        # A connection per call: they are cheap and cannot leak across forked workers
+        import sqlite3
+        connection = sqlite3.connect(self.path, timeout=1.0)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _count(self, name):
+        with self._lock:
+            self.counters[name] += 1
+
+    def get(self, key):
+        """Returns the cached value for ``key`` or None"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.counters['hits'] += 1
+                self.counters['memory_hits'] += 1
+                return value
+
+        if self.path:
+            value = self._disk_get(key)
+            if value is not None:
+                self._remember(key, value)
+                with self._lock:
+                    self.counters['hits'] += 1
+                    self.counters['disk_hits'] += 1
+                return value
+        self._count('misses')
+        return None
+
+    def put(self, key, value):
+        """Stores ``value`` under ``key`` in every tier"""
+        self._remember(key, value)
+        if self.path:
+            self._disk_put(key, value)
+        self._count('stores')
+
+    def _remember(self, key, value):
+        # Values bigger than the whole tier would only evict everything else
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = value
+            self._bytes += len(value)
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.counters['evictions'] += 1
+
+    def _disk_get(self, key):
+        import sqlite3
+        try:
+            with self._connect() as connection:
+                row = connection.execute('SELECT value FROM results WHERE key = ?', (key,)).fetchone()
+                if row is None:
+                    return None
+                connection.execute('UPDATE results SET accessed = ? WHERE key = ?', (time.time(), key))
+                return bytes(row[0])
+        except sqlite3.Error:
+            self._count('disk_errors')
+            return None
+
+    def _disk_put(self, key, value):
+        import sqlite3
+        if len(value) > self.max_disk_bytes:
+            return
+        try:
+            with self._connect() as connection:
+                connection.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)',
+                                   (key, value, len(value), time.time()))
+                total = connection.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+                if total > self.max_disk_bytes:
+                    # Drop least recently used rows until the file is back under its bound
+                    doomed = []
+                    for old_key, size in connection.execute(
+                            'SELECT key, size FROM results ORDER BY accessed'):
+                        if total <= self.max_disk_bytes:
+                            break
+                        doomed.append((old_key,))
+                        total -= size
+                    connection.executemany('DELETE FROM results WHERE key = ?', doomed)
+                    with self._lock:
+                        self.counters['disk_evictions'] += len(doomed)
+        except sqlite3.Error:
+            self._count('disk_errors')
+
+    def clear(self):
+        """Empties every tier; counters are kept"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if self.path:
+            import sqlite3
+            try:
+                with self._connect() as connection:
+                    connection.execute('DELETE FROM results')
+            except sqlite3.Error:
+                self._count('disk_errors')
+
+    def stats(self):
+        """Returns the counters plus the current size of each tier"""
+        with self._lock:
+            stats = dict(self.counters)
+            stats.update(entries=len(self._entries), bytes=self._bytes, max_bytes=self.max_bytes)
+        if self.path:
+            import sqlite3
+            try:
+                with self._connect() as connection:
+                    entries, size = connection.execute(
+                        'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results').fetchone()
+                stats.update(disk_entries=entries, disk_bytes=size, max_disk_bytes=self.max_disk_bytes)
+            except sqlite3.Error:
+                stats['disk_errors'] += 1
+        return stats
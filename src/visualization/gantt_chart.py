@@ -1,9 +1,7 @@
-import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 import tkinter as tk
 from tkinter import ttk
-import numpy as np
 
 class GanttChart:
     def __init__(self, master):
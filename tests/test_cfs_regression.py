@@ -0,0 +1,130 @@
+"""CFS engine against a tick-by-tick reference.
+
+The reference keeps runnable processes in a plain list, scans it for the
+smallest vruntime and runs each slice one time unit at a time, admitting
+arrivals at the queue's min_vruntime as their time comes. The engine's heap
+and jumps over idle time must give the same timeline and per-process
+results.
+"""
+
+import os
+import random
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.process import Process
+from src.core.process_table import ProcessTable
+from src.core.scheduler import CFSScheduler
+
+WORKLOADS = 300
+
+def weight_of(process):
+    nice = max(-20, min(19, process.priority))
+    return CFSScheduler.PRIO_TO_WEIGHT[nice + 20]
+
+def reference_cfs(processes, target_latency=8, min_granularity=1):
+    """Returns the (start, end, pid) slices of a CFS run, setting process results"""
+    # Ties on vruntime go to the earlier process in the input
+    pending = sorted(enumerate(processes), key=lambda item: item[1].arrival_time)
+    runnable = []  # [vruntime, input index, process, remaining_time]
+    slices = []
+    total_weight = 0
+    min_vruntime = 0.0
+    current_time = 0
+
+    def admit():
+        nonlocal total_weight
+        while pending and pending[0][1].arrival_time <= current_time:
+            index, process = pending.pop(0)
+            runnable.append([min_vruntime, index, process, process.burst_time])
+            total_weight += weight_of(process)
+
+    while pending or runnable:
+        admit()
+        if not runnable:
+            current_time += 1
+            continue
+
+        entry = min(runnable, key=lambda entry: (entry[0], entry[1]))
+        runnable.remove(entry)
+        vruntime, index, process, remaining_time = entry
+        min_vruntime = max(min_vruntime, vruntime)
+        weight = weight_of(process)
+        if process.start_time is None:
+            process.start_time = current_time
+
+        time_slice = max(min_granularity, target_latency * weight // total_weight)
+        execution_time = min(time_slice, remaining_time)
+        start = current_time
+        for _ in range(execution_time):
+            current_time += 1
+            admit()
+        slices.append((start, current_time, process.pid))
+        remaining_time -= execution_time
+        vruntime += execution_time * 1024 / weight
+
+        if remaining_time:
+            runnable.append([vruntime, index, process, remaining_time])
+        else:
+            process.completion_time = current_time
+            process.waiting_time = current_time - process.arrival_time - process.burst_time
+            total_weight -= weight
+    return slices
+
+def random_case(seed):
+    rng = random.Random(seed)
+    count = rng.randint(1, 25)
+    # Nice values past -20..19 are clamped
+    processes = [Process(pid, rng.randint(0, 40), rng.randint(1, 20), rng.randint(-25, 25))
+                 for pid in range(1, count + 1)]
+    rng.shuffle(processes)
+    min_granularity = rng.randint(1, 3)
+    target_latency = rng.randint(min_granularity, 24)
+    return processes, target_latency, min_granularity
+
+def copies(processes):
+    return [Process(int(p.pid[1:]), p.arrival_time, p.burst_time, p.priority) for p in processes]
+
+def results_of(processes):
+    return sorted((str(p), p.start_time, p.completion_time, p.waiting_time) for p in processes)
+
+def test_matches_reference_on_process_lists():
+    for seed in range(WORKLOADS):
+        workload, target_latency, min_granularity = random_case(seed)
+        expected_processes = copies(workload)
+        expected = reference_cfs(expected_processes, target_latency, min_granularity)
+
+        scheduler = CFSScheduler(target_latency, min_granularity)
+        scheduler.processes = copies(workload)
+        slices = [(start, end, str(process)) for start, end, process in scheduler.iter_schedule()]
+        assert slices == expected, f"seed {seed}"
+        assert results_of(scheduler.processes) == results_of(expected_processes), f"seed {seed}"
+
+def test_matches_reference_on_process_tables():
+    for seed in range(WORKLOADS):
+        workload, target_latency, min_granularity = random_case(seed)
+        expected_processes = copies(workload)
+        expected = reference_cfs(expected_processes, target_latency, min_granularity)
+
+        table = ProcessTable.from_processes(workload)
+        scheduler = CFSScheduler(target_latency, min_granularity)
+        scheduler.processes = table
+        timeline = scheduler.schedule_columnar()
+        assert [(start, end, table[index].pid) for start, end, index in timeline] == expected, \
+            f"seed {seed}"
+        assert results_of(table) == results_of(expected_processes), f"seed {seed}"
+
+def test_equal_weights_share_the_cpu_evenly():
+    # Processes that arrive together with the same nice value get equal CPU
+    # time until the shortest one finishes
+    for seed in range(100):
+        rng = random.Random(seed)
+        count = rng.randint(2, 8)
+        processes = [Process(pid, 0, 200, 0) for pid in range(1, count + 1)]
+        scheduler = CFSScheduler(rng.randint(count, 4 * count), 1)
+        scheduler.processes = processes
+        received = dict.fromkeys((str(p) for p in processes), 0)
+        for start, end, process in scheduler.iter_schedule():
+            received[str(process)] += end - start
+            assert max(received.values()) - min(received.values()) <= end - start, f"seed {seed}"
@@ -0,0 +1,55 @@
+"""Scheduler counters collected through Instrumentation.
+
+``heap_pushes`` and ``heap_pops`` count ready-queue operations only: every
+slice of a heap-based engine starts with one pop of an entry pushed once,
+so both must equal the number of dispatches. Event and arrival heaps must
+not show up in them.
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.instrumentation import Instrumentation
+from src.core.process import Process
+from src.core.scheduler import (SJFScheduler, PriorityScheduler, SRTFScheduler,
+                                PreemptivePriorityScheduler, CFSScheduler, EDFScheduler,
+                                MultiCoreScheduler)
+
+WORKLOADS = 50
+
+HEAP_SCHEDULERS = [
+    SJFScheduler,
+    PriorityScheduler,
+    SRTFScheduler,
+    PreemptivePriorityScheduler,
+    CFSScheduler,
+    EDFScheduler,
+    lambda: MultiCoreScheduler(3, 'FCFS'),
+    lambda: MultiCoreScheduler(3, 'RR', 2, 'per-core'),
+    lambda: MultiCoreScheduler(4, 'SJF', queue_mode='per-core'),
+]
+
+def random_workload(seed):
+    rng = random.Random(seed)
+    return [Process(pid, rng.randint(0, 60), rng.randint(1, 9), rng.randint(0, 4),
+                    rng.choice([None, rng.randint(1, 30)]))
+            for pid in range(1, rng.randint(1, 40) + 1)]
+
+@pytest.mark.parametrize('make_scheduler', HEAP_SCHEDULERS)
+def test_heap_counters_cover_the_ready_queue_only(make_scheduler):
+    for seed in range(WORKLOADS):
+        scheduler = make_scheduler()
+        scheduler.processes = random_workload(seed)
+        instrumentation = Instrumentation()
+        scheduler.instrumentation = instrumentation
+        slices = list(scheduler.iter_schedule())
+        counters = instrumentation.counters
+        assert counters['dispatches'] == len(slices), f"seed {seed}"
+        assert counters['heap_pushes'] == counters['heap_pops'] == len(slices), f"seed {seed}"
+        # The class-level functions are back once the run is over
+        assert '_heappush' not in vars(scheduler)
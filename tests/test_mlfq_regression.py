@@ -0,0 +1,116 @@
+"""MLFQ engine against a tick-by-tick reference.
+
+The reference keeps every level as a plain list, advances time one unit at a
+time (also while the CPU is idle) and admits arrivals as their time comes.
+The engine's deques, level bitmask and jumps to the next arrival must give
+the same timeline and per-process results.
+"""
+
+import os
+import random
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.process import Process
+from src.core.process_table import ProcessTable
+from src.core.scheduler import MLFQScheduler, RoundRobinScheduler
+
+WORKLOADS = 300
+
+def reference_mlfq(processes, level_quanta, boost_interval=None):
+    """Returns the (start, end, pid) slices of an MLFQ run, setting process results"""
+    pending = sorted(processes, key=lambda p: p.arrival_time)
+    levels = [[] for _ in level_quanta]
+    remaining = {p.pid: p.burst_time for p in processes}
+    slices = []
+    current_time = 0
+    next_boost = boost_interval
+
+    def admit():
+        while pending and pending[0].arrival_time <= current_time:
+            levels[0].append(pending.pop(0))
+
+    while pending or any(levels):
+        admit()
+        if boost_interval is not None and current_time >= next_boost:
+            levels[0] = [p for level in levels for p in level]
+            for level in range(1, len(levels)):
+                levels[level] = []
+            next_boost = (current_time // boost_interval + 1) * boost_interval
+
+        level = next((number for number, queue in enumerate(levels) if queue), None)
+        if level is None:
+            current_time += 1
+            continue
+
+        process = levels[level].pop(0)
+        if process.start_time is None:
+            process.start_time = current_time
+        start = current_time
+        # The slice is not preempted: arrivals wait in level 0 until it ends
+        for _ in range(min(level_quanta[level], remaining[process.pid])):
+            current_time += 1
+            remaining[process.pid] -= 1
+            admit()
+        slices.append((start, current_time, process.pid))
+
+        if remaining[process.pid]:
+            levels[min(level + 1, len(levels) - 1)].append(process)
+        else:
+            process.completion_time = current_time
+            process.waiting_time = current_time - process.arrival_time - process.burst_time
+    return slices
+
+def random_case(seed):
+    rng = random.Random(seed)
+    count = rng.randint(1, 30)
+    processes = [Process(pid, rng.randint(0, 60), rng.randint(1, 15), rng.randint(0, 4))
+                 for pid in range(1, count + 1)]
+    rng.shuffle(processes)
+    level_quanta = [rng.randint(1, 5) for _ in range(rng.randint(1, 4))]
+    boost_interval = rng.choice([None, rng.randint(1, 25)])
+    return processes, level_quanta, boost_interval
+
+def copies(processes):
+    return [Process(int(p.pid[1:]), p.arrival_time, p.burst_time, p.priority) for p in processes]
+
+def results_of(processes):
+    return sorted((str(p), p.start_time, p.completion_time, p.waiting_time) for p in processes)
+
+def test_matches_reference_on_process_lists():
+    for seed in range(WORKLOADS):
+        workload, level_quanta, boost_interval = random_case(seed)
+        expected_processes = copies(workload)
+        expected = reference_mlfq(expected_processes, level_quanta, boost_interval)
+
+        scheduler = MLFQScheduler(level_quanta, boost_interval)
+        scheduler.processes = copies(workload)
+        slices = [(start, end, str(process)) for start, end, process in scheduler.iter_schedule()]
+        assert slices == expected, f"seed {seed}"
+        assert results_of(scheduler.processes) == results_of(expected_processes), f"seed {seed}"
+
+def test_matches_reference_on_process_tables():
+    for seed in range(WORKLOADS):
+        workload, level_quanta, boost_interval = random_case(seed)
+        expected_processes = copies(workload)
+        expected = reference_mlfq(expected_processes, level_quanta, boost_interval)
+
+        table = ProcessTable.from_processes(workload)
+        scheduler = MLFQScheduler(level_quanta, boost_interval)
+        scheduler.processes = table
+        timeline = scheduler.schedule_columnar()
+        assert [(start, end, table[index].pid) for start, end, index in timeline] == expected, \
+            f"seed {seed}"
+        assert results_of(table) == results_of(expected_processes), f"seed {seed}"
+
+def test_single_level_is_round_robin():
+    for seed in range(WORKLOADS):
+        workload, _, _ = random_case(seed)
+        mlfq = MLFQScheduler([3])
+        mlfq.processes = copies(workload)
+        round_robin = RoundRobinScheduler(3)
+        round_robin.processes = copies(workload)
+        assert ([(start, str(p)) for start, p in mlfq.schedule()] ==
+                [(start, str(p)) for start, p in round_robin.schedule()]), f"seed {seed}"
+        assert results_of(mlfq.processes) == results_of(round_robin.processes), f"seed {seed}"
@@ -0,0 +1,168 @@
+"""Multi-core engine against a tick-by-tick reference.
+
+The reference keeps the ready queue as a plain list and advances time one
+unit at a time. At each time unit it admits arrivals first, then the slices
+that end there (in the order they were dispatched), and hands every free
+core the best-ranked ready process. Which core runs a slice does not change
+the process-level timeline, so the engine's event heaps must give the same
+slices and per-process results. Per-core timelines are checked separately:
+a single core must match the single-core engines, and no core may sit idle
+while ready work is waiting, in either queue mode.
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.process import Process
+from src.core.process_table import ProcessTable
+from src.core.scheduler import (FCFSScheduler, SJFScheduler, PriorityScheduler,
+                                RoundRobinScheduler, MultiCoreScheduler)
+
+WORKLOADS = 200
+
+def rank(policy, process, index, ready_time, sequence):
+    if policy == 'SJF':
+        return (process.burst_time, process.pid, index)
+    if policy == 'Priority':
+        return (process.priority, process.arrival_time, process.pid, index)
+    return (ready_time, sequence)
+
+def reference_multicore(processes, num_cores, policy, time_quantum=2):
+    """Returns the (start, end, pid) slices in dispatch order, setting process results"""
+    pending = sorted(enumerate(processes), key=lambda item: item[1].arrival_time)
+    ready = []  # [rank, input index, process, remaining_time]
+    running = []  # [time left, slice start, input index, process, remaining_time]
+    slices = []
+    sequence = 0
+    current_time = 0
+
+    while pending or ready or running:
+        while pending and pending[0][1].arrival_time <= current_time:
+            index, process = pending.pop(0)
+            ready.append([rank(policy, process, index, current_time, sequence),
+                          index, process, process.burst_time])
+            sequence += 1
+        # running stays in dispatch order
+        for entry in [entry for entry in running if not entry[0]]:
+            running.remove(entry)
+            _, _, index, process, remaining_time = entry
+            if remaining_time:
+                ready.append([rank(policy, process, index, current_time, sequence),
+                              index, process, remaining_time])
+                sequence += 1
+            else:
+                process.completion_time = current_time
+                process.waiting_time = current_time - process.arrival_time - process.burst_time
+
+        while ready and len(running) < num_cores:
+            entry = min(ready, key=lambda entry: entry[0])
+            ready.remove(entry)
+            _, index, process, remaining_time = entry
+            if process.start_time is None:
+                process.start_time = current_time
+            execution_time = remaining_time
+            if policy == 'RR':
+                execution_time = min(time_quantum, remaining_time)
+            slices.append((current_time, current_time + execution_time, process.pid))
+            running.append([execution_time, current_time, index, process,
+                            remaining_time - execution_time])
+
+        current_time += 1
+        for entry in running:
+            entry[0] -= 1
+    return slices
+
+def random_case(seed):
+    rng = random.Random(seed)
+    count = rng.randint(1, 30)
+    processes = [Process(pid, rng.randint(0, 40), rng.randint(1, 12), rng.randint(0, 4))
+                 for pid in range(1, count + 1)]
+    rng.shuffle(processes)
+    return processes, rng.randint(1, 5), rng.randint(1, 4)
+
+def copies(processes):
+    return [Process(int(p.pid[1:]), p.arrival_time, p.burst_time, p.priority) for p in processes]
+
+def results_of(processes):
+    return sorted((str(p), p.start_time, p.completion_time, p.waiting_time) for p in processes)
+
+@pytest.mark.parametrize('policy', MultiCoreScheduler.POLICIES)
+def test_global_queue_matches_reference(policy):
+    for seed in range(WORKLOADS):
+        workload, num_cores, time_quantum = random_case(seed)
+        expected_processes = copies(workload)
+        expected = reference_multicore(expected_processes, num_cores, policy, time_quantum)
+
+        scheduler = MultiCoreScheduler(num_cores, policy, time_quantum)
+        scheduler.processes = copies(workload)
+        slices = [(start, end, str(process)) for start, end, process in scheduler.iter_schedule()]
+        assert slices == expected, f"seed {seed}"
+        assert results_of(scheduler.processes) == results_of(expected_processes), f"seed {seed}"
+
+        table = ProcessTable.from_processes(workload)
+        scheduler = MultiCoreScheduler(num_cores, policy, time_quantum)
+        scheduler.processes = table
+        timeline = scheduler.schedule_columnar()
+        assert [(start, end, table[index].pid) for start, end, index in timeline] == expected, \
+            f"seed {seed}"
+        assert results_of(table) == results_of(expected_processes), f"seed {seed}"
+
+SINGLE_CORE = [
+    ('FCFS', lambda quantum: FCFSScheduler()),
+    ('SJF', lambda quantum: SJFScheduler()),
+    ('Priority', lambda quantum: PriorityScheduler()),
+    ('RR', lambda quantum: RoundRobinScheduler(quantum)),
+]
+
+@pytest.mark.parametrize('queue_mode', MultiCoreScheduler.QUEUE_MODES)
+@pytest.mark.parametrize('policy, make_single_core', SINGLE_CORE)
+def test_one_core_matches_single_core_engine(policy, make_single_core, queue_mode):
+    for seed in range(WORKLOADS):
+        workload, _, time_quantum = random_case(seed)
+        multi_core = MultiCoreScheduler(1, policy, time_quantum, queue_mode)
+        multi_core.processes = copies(workload)
+        single_core = make_single_core(time_quantum)
+        single_core.processes = copies(workload)
+        assert ([(start, end, str(p)) for start, end, p in multi_core.iter_schedule()] ==
+                [(start, end, str(p)) for start, end, p in single_core.iter_schedule()]), \
+            f"seed {seed}"
+        assert results_of(multi_core.processes) == results_of(single_core.processes), \
+            f"seed {seed}"
+
+@pytest.mark.parametrize('queue_mode', MultiCoreScheduler.QUEUE_MODES)
+@pytest.mark.parametrize('policy', MultiCoreScheduler.POLICIES)
+def test_no_core_idles_while_work_is_ready(policy, queue_mode):
+    for seed in range(WORKLOADS):
+        workload, num_cores, time_quantum = random_case(seed)
+        table = ProcessTable.from_processes(workload)
+        scheduler = MultiCoreScheduler(num_cores, policy, time_quantum, queue_mode)
+        scheduler.processes = table
+        scheduler.schedule_columnar()
+
+        running = {}  # time -> input indices running then
+        for core, timeline in enumerate(scheduler.core_timelines):
+            previous_end = 0
+            for start, end, index in timeline:
+                assert start >= previous_end, f"seed {seed}: core {core} overlaps itself"
+                previous_end = end
+                for time in range(start, end):
+                    running.setdefault(time, []).append(index)
+        assert scheduler.core_busy_times == [sum(end - start for start, end, _ in timeline)
+                                             for timeline in scheduler.core_timelines]
+
+        for time, indices in running.items():
+            assert len(indices) == len(set(indices)), f"seed {seed}: two cores run one process"
+        for index, row in enumerate(table):
+            ran = sum(index in indices for indices in running.values())
+            assert ran == row.burst_time, f"seed {seed}"
+
+        for time in range(max(running, default=-1) + 1):
+            busy = running.get(time, [])
+            waiting = [index for index, row in enumerate(table)
+                       if row.arrival_time <= time < row.completion_time and index not in busy]
+            assert len(busy) == num_cores or not waiting, f"seed {seed} time {time}"
@@ -0,0 +1,119 @@
+"""SRTF and Preemptive Priority engines against a tick-by-tick reference.
+
+The shared event loop only re-evaluates the running process when something
+arrives. The reference instead hands every time unit to the best-ranked
+arrived process, which must give the same timeline and per-process results.
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.process import Process
+from src.core.process_table import ProcessTable
+from src.core.scheduler import SRTFScheduler, PreemptivePriorityScheduler
+
+WORKLOADS = 300
+
+def reference_schedule(processes, rank):
+    """Runs the best-ranked arrived process for each time unit; returns merged runs.
+
+    ``rank(process, remaining_time)`` orders the candidates, smallest first.
+    """
+    remaining = {process.pid: process.burst_time for process in processes}
+    runs = []
+    current_time = 0
+    unfinished = len(processes)
+    while unfinished:
+        ready = [p for p in processes if p.arrival_time <= current_time and remaining[p.pid]]
+        if not ready:
+            current_time += 1
+            continue
+        process = min(ready, key=lambda p: rank(p, remaining[p.pid]))
+        if process.start_time is None:
+            process.start_time = current_time
+        if runs and runs[-1][1] == current_time and runs[-1][2] == process.pid:
+            runs[-1][1] += 1
+        else:
+            runs.append([current_time, current_time + 1, process.pid])
+        current_time += 1
+        remaining[process.pid] -= 1
+        if not remaining[process.pid]:
+            process.completion_time = current_time
+            process.waiting_time = current_time - process.arrival_time - process.burst_time
+            unfinished -= 1
+    return [tuple(run) for run in runs]
+
+def srtf_rank(process, remaining_time):
+    return (remaining_time, process.arrival_time, process.pid)
+
+def priority_rank(process, remaining_time):
+    return (process.priority, process.arrival_time, process.pid)
+
+CASES = [
+    (SRTFScheduler, srtf_rank),
+    (PreemptivePriorityScheduler, priority_rank),
+]
+
+def random_workload(seed):
+    rng = random.Random(seed)
+    count = rng.randint(1, 30)
+    processes = [Process(pid, rng.randint(0, 40), rng.randint(1, 12), rng.randint(0, 4))
+                 for pid in range(1, count + 1)]
+    rng.shuffle(processes)
+    return processes
+
+def copies(processes):
+    return [Process(int(p.pid[1:]), p.arrival_time, p.burst_time, p.priority) for p in processes]
+
+def merged(slices):
+    runs = []
+    for start, end, process in slices:
+        if runs and runs[-1][1] == start and runs[-1][2] == str(process):
+            runs[-1][1] = end
+        else:
+            runs.append([start, end, str(process)])
+    return [tuple(run) for run in runs]
+
+def results_of(processes):
+    return sorted((str(p), p.start_time, p.completion_time, p.waiting_time) for p in processes)
+
+@pytest.mark.parametrize('scheduler_class, rank', CASES)
+def test_matches_reference_on_process_lists(scheduler_class, rank):
+    for seed in range(WORKLOADS):
+        workload = random_workload(seed)
+        expected_processes = copies(workload)
+        expected = reference_schedule(expected_processes, rank)
+
+        scheduler = scheduler_class()
+        scheduler.processes = copies(workload)
+        assert merged(scheduler.iter_schedule()) == expected, f"seed {seed}"
+        assert results_of(scheduler.processes) == results_of(expected_processes), f"seed {seed}"
+
+@pytest.mark.parametrize('scheduler_class, rank', CASES)
+def test_matches_reference_on_process_tables(scheduler_class, rank):
+    for seed in range(WORKLOADS):
+        workload = random_workload(seed)
+        expected_processes = copies(workload)
+        expected = reference_schedule(expected_processes, rank)
+
+        table = ProcessTable.from_processes(workload)
+        scheduler = scheduler_class()
+        scheduler.processes = table
+        timeline = scheduler.schedule_columnar()
+        assert merged((start, end, table[index]) for start, end, index in timeline) == expected, \
+            f"seed {seed}"
+        assert results_of(table) == results_of(expected_processes), f"seed {seed}"
+
+@pytest.mark.parametrize('scheduler_class, rank', CASES)
+def test_slices_never_continue_the_same_process(scheduler_class, rank):
+    # A process is only preempted for one that strictly outranks it
+    for seed in range(WORKLOADS):
+        scheduler = scheduler_class()
+        scheduler.processes = random_workload(seed)
+        slices = list(scheduler.iter_schedule())
+        assert len(merged(slices)) == len(slices), f"seed {seed}"
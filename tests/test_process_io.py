@@ -0,0 +1,103 @@
+"""Trace readers and writers.
+
+The streaming JSON reader must accept exactly what ``json.load`` accepts for
+an array of processes, whatever buffer size it reads with. Binary traces must
+read back exactly what was written, real-time columns included, through
+every reader.
+"""
+
+import json
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.process import Process
+from src.core.process_table import ProcessTable
+from src.utils.process_io import ProcessIO, ProcessIOError
+
+RECORD = {'pid': 'P1', 'arrival_time': 0, 'burst_time': 3, 'priority': 2}
+BUFFER_SIZES = (1, 3, 7, 1 << 20)
+
+def write(tmp_path, text, name='trace.json'):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+def test_iter_json_reads_what_json_load_reads(tmp_path):
+    record = json.dumps(RECORD)
+    for text in ('[]', ' [ ]\n\n', f'[{record}]', f'\n[ {record} ,\n{record} ]  \n'):
+        path = write(tmp_path, text)
+        expected = [str(p) for p in ProcessIO.import_from_json(path)]
+        for buffer_size in BUFFER_SIZES:
+            assert [str(p) for p in ProcessIO.iter_json(path, buffer_size)] == expected, text
+
+@pytest.mark.parametrize('text', [
+    '',
+    '[] xyz',
+    '[]]',
+    f'[{json.dumps(RECORD)}] garbage',
+    f'[{json.dumps(RECORD)}]' + ' ' * 40 + ',',
+    f'[{json.dumps(RECORD)}',
+    f'[{json.dumps(RECORD)},]',
+    f'[{json.dumps(RECORD)} {json.dumps(RECORD)}]',
+])
+def test_iter_json_rejects_what_json_load_rejects(tmp_path, text):
+    path = write(tmp_path, text)
+    with pytest.raises(ProcessIOError):
+        ProcessIO.import_from_json(path)
+    for buffer_size in BUFFER_SIZES:
+        with pytest.raises(ProcessIOError):
+            list(ProcessIO.iter_json(path, buffer_size))
+
+def fields_of(processes):
+    return [(str(p.pid), p.arrival_time, p.burst_time, p.priority,
+             getattr(p, 'deadline', None), getattr(p, 'period', None)) for p in processes]
+
+def random_processes(seed):
+    rng = random.Random(seed)
+    return [Process(pid, rng.randint(0, 1 << 40), rng.randint(1, 50), rng.randint(-5, 5),
+                    rng.choice([None, 0, rng.randint(1, 100)]),
+                    rng.choice([None, rng.randint(1, 100)]))
+            for pid in range(1, rng.randint(0, 40) + 1)]
+
+def test_binary_trace_round_trip(tmp_path):
+    path = str(tmp_path / 'trace.trace')
+    for seed in range(50):
+        processes = random_processes(seed)
+        ProcessIO.export_to_binary(processes, path)
+        expected = fields_of(processes)
+        assert fields_of(ProcessIO.import_from_binary(path)) == expected, f"seed {seed}"
+        assert fields_of(ProcessIO.iter_binary(path)) == expected, f"seed {seed}"
+        assert ProcessIO.binary_has_real_time(path) == any(
+            p.deadline is not None or p.period is not None for p in processes), f"seed {seed}"
+
+        # ProcessTable has no real-time columns; the rest maps straight in
+        table = ProcessIO.load_binary(path)
+        assert [fields[:4] for fields in fields_of(table)] == [fields[:4] for fields in expected], \
+            f"seed {seed}"
+        arrivals = [p.arrival_time for p in processes]
+        assert table.arrival_sorted == (arrivals == sorted(arrivals)), f"seed {seed}"
+
+def test_binary_trace_from_process_table(tmp_path):
+    path = str(tmp_path / 'trace.trace')
+    processes = [Process(pid, arrival, 3, 1) for pid, arrival in ((1, 0), (2, 4), (3, 4))]
+    ProcessIO.export_to_binary(ProcessTable.from_processes(processes), path)
+    assert fields_of(ProcessIO.import_from_binary(path)) == fields_of(processes)
+    assert not ProcessIO.binary_has_real_time(path)
+    assert ProcessIO.load_binary(path).arrival_sorted
+
+def test_binary_trace_rejects_other_files(tmp_path):
+    path = str(tmp_path / 'trace.trace')
+    ProcessIO.export_to_binary(random_processes(1), path)
+    data = open(path, 'rb').read()
+    for broken in (b'', data[:16], b'NOTATRACE' + data[9:], data[:-1]):
+        with open(path, 'wb') as f:
+            f.write(broken)
+        with pytest.raises(ProcessIOError):
+            ProcessIO.load_binary(path)
+        with pytest.raises(ProcessIOError):
+            ProcessIO.import_from_binary(path)
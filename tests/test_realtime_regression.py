@@ -0,0 +1,188 @@
+"""EDF and Rate Monotonic engines against a tick-by-tick reference.
+
+The reference expands periodic tasks into jobs on its own, then hands every
+time unit to the highest-ranked released job. The engines must produce the
+same timeline, per-job results and deadline metrics, and ``job_count`` and
+``max_jobs`` must agree with the jobs actually released.
+"""
+
+import math
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.metrics import PerformanceMetrics
+from src.core.process import Process
+from src.core.scheduler import EDFScheduler, RateMonotonicScheduler
+from src.core.streaming_metrics import MetricsAccumulator
+
+WORKLOADS = 200
+
+def reference_jobs(tasks, horizon=None):
+    if horizon is None:
+        periods = [task.period for task in tasks if task.period]
+        first_releases = [task.arrival_time for task in tasks if task.period]
+        horizon = max(first_releases, default=0) + (math.lcm(*periods) if periods else 0)
+    jobs = []
+    for task in tasks:
+        if not task.period:
+            jobs.append(Process(task.pid[1:], task.arrival_time, task.burst_time, task.priority,
+                                task.deadline))
+            continue
+        release, number = task.arrival_time, 0
+        while release < horizon:
+            job = Process(task.pid[1:], release, task.burst_time, task.priority,
+                          task.deadline, task.period)
+            job.pid = f"{task.pid}.{number}"
+            jobs.append(job)
+            release += task.period
+            number += 1
+    return jobs
+
+def edf_rank(job):
+    deadline = job.absolute_deadline
+    return (math.inf if deadline is None else deadline, job.arrival_time, job.pid)
+
+def rm_rank(job):
+    return (job.period if job.period else math.inf, job.arrival_time, job.pid)
+
+def reference_schedule(jobs, rank):
+    """Runs the best-ranked released job for each time unit; returns merged runs"""
+    remaining = {job.pid: job.burst_time for job in jobs}
+    runs = []
+    current_time = 0
+    unfinished = len(jobs)
+    while unfinished:
+        ready = [job for job in jobs if job.arrival_time <= current_time and remaining[job.pid]]
+        if not ready:
+            current_time += 1
+            continue
+        job = min(ready, key=rank)
+        if job.start_time is None:
+            job.start_time = current_time
+        if runs and runs[-1][1] == current_time and runs[-1][2] == job.pid:
+            runs[-1][1] += 1
+        else:
+            runs.append([current_time, current_time + 1, job.pid])
+        current_time += 1
+        remaining[job.pid] -= 1
+        if not remaining[job.pid]:
+            job.completion_time = current_time
+            job.waiting_time = current_time - job.arrival_time - job.burst_time
+            unfinished -= 1
+    return [tuple(run) for run in runs]
+
+def merged(slices):
+    runs = []
+    for start, end, process in slices:
+        if runs and runs[-1][1] == start and runs[-1][2] == process.pid:
+            runs[-1][1] = end
+        else:
+            runs.append([start, end, process.pid])
+    return [tuple(run) for run in runs]
+
+def results_of(jobs):
+    return sorted((job.pid, job.start_time, job.completion_time, job.waiting_time, job.lateness)
+                  for job in jobs)
+
+def random_tasks(seed):
+    rng = random.Random(seed)
+    tasks = []
+    for pid in range(1, rng.randint(1, 6) + 1):
+        period = rng.choice([None, 4, 5, 6, 8, 10, 12])
+        deadline = rng.choice([None, rng.randint(2, 15)]) if period else rng.randint(1, 30)
+        tasks.append(Process(pid, rng.randint(0, 10), rng.randint(1, 4), 0, deadline, period))
+    return tasks
+
+CASES = [
+    (EDFScheduler, edf_rank),
+    (RateMonotonicScheduler, rm_rank),
+]
+
+@pytest.mark.parametrize('scheduler_class, rank', CASES)
+def test_matches_reference(scheduler_class, rank):
+    for seed in range(WORKLOADS):
+        tasks = random_tasks(seed)
+        jobs = reference_jobs(tasks)
+        expected = reference_schedule(jobs, rank)
+
+        scheduler = scheduler_class()
+        scheduler.processes = tasks
+        assert merged(scheduler.iter_schedule()) == expected, f"seed {seed}"
+        assert results_of(scheduler.jobs) == results_of(jobs), f"seed {seed}"
+
+@pytest.mark.parametrize('scheduler_class, rank', CASES)
+def test_deadline_metrics_match_reference(scheduler_class, rank):
+    for seed in range(WORKLOADS):
+        tasks = random_tasks(seed)
+        jobs = reference_jobs(tasks)
+        reference_schedule(jobs, rank)
+        lateness = [job.lateness for job in jobs if job.lateness is not None]
+        misses = sum(1 for value in lateness if value > 0)
+
+        scheduler = scheduler_class()
+        scheduler.processes = tasks
+        timeline = scheduler.schedule_columnar()
+        metrics = PerformanceMetrics(scheduler.jobs, timeline)
+        assert metrics.deadline_misses() == misses, f"seed {seed}"
+        assert metrics.max_lateness() == max(lateness, default=0), f"seed {seed}"
+        assert metrics.average_lateness() == pytest.approx(
+            sum(lateness) / len(lateness) if lateness else 0), f"seed {seed}"
+
+        scheduler = scheduler_class()
+        scheduler.processes = tasks
+        accumulator = scheduler.schedule_into(MetricsAccumulator())
+        assert accumulator.deadline_misses == misses, f"seed {seed}"
+        assert accumulator.max_lateness == max(lateness, default=None), f"seed {seed}"
+
+def test_horizon_limits_releases():
+    for seed in range(WORKLOADS):
+        tasks = random_tasks(seed)
+        horizon = random.Random(seed).randint(1, 40)
+        jobs = reference_jobs(tasks, horizon)
+        expected = reference_schedule(jobs, edf_rank)
+
+        scheduler = EDFScheduler(horizon=horizon)
+        scheduler.processes = tasks
+        assert scheduler.job_count() == len(jobs), f"seed {seed}"
+        assert merged(scheduler.iter_schedule()) == expected, f"seed {seed}"
+        assert len(scheduler.jobs) == len(jobs), f"seed {seed}"
+
+def test_job_count_matches_released_jobs():
+    for seed in range(WORKLOADS):
+        tasks = random_tasks(seed)
+        scheduler = RateMonotonicScheduler()
+        scheduler.processes = tasks
+        count = scheduler.job_count()
+        scheduler.schedule()
+        assert count == len(scheduler.jobs) == len(reference_jobs(tasks)), f"seed {seed}"
+
+def test_max_jobs_rejects_before_releasing():
+    tasks = [Process(1, 0, 1, 0, None, 7919), Process(2, 0, 1, 0, None, 7907),
+             Process(3, 0, 1, 0, None, 7901)]
+    scheduler = EDFScheduler(max_jobs=1000)
+    scheduler.processes = tasks
+    assert scheduler.job_count() > 10 ** 8
+    with pytest.raises(ValueError, match="more than 1000 jobs"):
+        scheduler.schedule()
+    assert scheduler.jobs == []
+
+    # A shorter horizon brings the same task set under the cap
+    scheduler = EDFScheduler(horizon=7919 * 100, max_jobs=1000)
+    scheduler.processes = tasks
+    assert scheduler.job_count() <= 1000
+    assert len(scheduler.schedule()) == scheduler.job_count()
+
+def test_max_jobs_is_inclusive():
+    tasks = [Process(1, 0, 1, 0, None, 2)]
+    scheduler = EDFScheduler(horizon=20, max_jobs=10)
+    scheduler.processes = tasks
+    assert len(scheduler.schedule()) == 10
+    scheduler = EDFScheduler(horizon=21, max_jobs=10)
+    scheduler.processes = tasks
+    with pytest.raises(ValueError):
+        scheduler.schedule()
@@ -0,0 +1,138 @@
+"""SJF and Priority engines against the original O(n^2) scheduling loops.
+
+The reference loops below are the implementations the heap-based engine
+replaced. Every engine entry point (process lists, arrival-ordered streams
+and ``ProcessTable`` with a columnar timeline) must give the same timeline
+and per-process results on random workloads.
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.process import Process
+from src.core.process_table import ProcessTable
+from src.core.scheduler import SJFScheduler, PriorityScheduler
+
+WORKLOADS = 300
+
+def reference_sjf(processes):
+    timeline = []
+    remaining_processes = [(p, p.burst_time) for p in processes]
+    current_time = 0
+
+    while remaining_processes:
+        ready_processes = [
+            (p, rt) for p, rt in remaining_processes
+            if p.arrival_time <= current_time
+        ]
+
+        if not ready_processes:
+            current_time = min(p.arrival_time for p, _ in remaining_processes)
+            continue
+
+        process, remaining_time = min(ready_processes, key=lambda x: (x[1], x[0].pid))
+        if process.start_time is None:
+            process.start_time = current_time
+
+        timeline.append((current_time, process))
+        current_time += remaining_time
+
+        remaining_processes.remove((process, remaining_time))
+        process.completion_time = current_time
+        process.waiting_time = process.completion_time - process.arrival_time - process.burst_time
+
+    return timeline
+
+def reference_priority(processes):
+    timeline = []
+    remaining_processes = list(processes)
+    current_time = 0
+
+    while remaining_processes:
+        ready_processes = [
+            p for p in remaining_processes
+            if p.arrival_time <= current_time
+        ]
+
+        if not ready_processes:
+            current_time = min(p.arrival_time for p in remaining_processes)
+            continue
+
+        process = min(ready_processes, key=lambda p: (p.priority, p.arrival_time, p.pid))
+        remaining_processes.remove(process)
+
+        process.start_time = current_time
+        process.waiting_time = current_time - process.arrival_time
+        timeline.append((current_time, process))
+
+        current_time += process.burst_time
+        process.completion_time = current_time
+
+    return timeline
+
+CASES = [
+    (SJFScheduler, reference_sjf),
+    (PriorityScheduler, reference_priority),
+]
+
+def random_workload(seed):
+    rng = random.Random(seed)
+    count = rng.randint(1, 60)
+    # Few distinct values, so ties on burst, priority and arrival are common
+    processes = [Process(pid, rng.randint(0, 40), rng.randint(1, 10), rng.randint(0, 4))
+                 for pid in range(1, count + 1)]
+    rng.shuffle(processes)
+    return processes
+
+def copies(processes):
+    return [Process(int(p.pid[1:]), p.arrival_time, p.burst_time, p.priority) for p in processes]
+
+def timeline_of(pairs):
+    return [(time, str(process)) for time, process in pairs]
+
+def results_of(processes):
+    return sorted((str(p), p.start_time, p.completion_time, p.waiting_time) for p in processes)
+
+@pytest.mark.parametrize('scheduler_class, reference', CASES)
+def test_matches_reference_on_process_lists(scheduler_class, reference):
+    for seed in range(WORKLOADS):
+        workload = random_workload(seed)
+        expected_processes = copies(workload)
+        expected = timeline_of(reference(expected_processes))
+
+        scheduler = scheduler_class()
+        scheduler.processes = copies(workload)
+        assert timeline_of(scheduler.schedule()) == expected, f"seed {seed}"
+        assert results_of(scheduler.processes) == results_of(expected_processes), f"seed {seed}"
+
+@pytest.mark.parametrize('scheduler_class, reference', CASES)
+def test_matches_reference_on_arrival_streams(scheduler_class, reference):
+    for seed in range(WORKLOADS):
+        workload = random_workload(seed)
+        expected_processes = copies(workload)
+        expected = timeline_of(reference(expected_processes))
+
+        processes = sorted(copies(workload), key=lambda p: p.arrival_time)
+        scheduler = scheduler_class()
+        scheduler.processes = iter(processes)
+        assert timeline_of((start, process) for start, _, process in scheduler.iter_schedule()) \
+            == expected, f"seed {seed}"
+        assert results_of(processes) == results_of(expected_processes), f"seed {seed}"
+
+@pytest.mark.parametrize('scheduler_class, reference', CASES)
+def test_matches_reference_on_process_tables(scheduler_class, reference):
+    for seed in range(WORKLOADS):
+        workload = random_workload(seed)
+        expected_processes = copies(workload)
+        expected = timeline_of(reference(expected_processes))
+
+        table = ProcessTable.from_processes(workload)
+        scheduler = scheduler_class()
+        scheduler.processes = table
+        assert timeline_of(scheduler.schedule_columnar().to_pairs(table)) == expected, f"seed {seed}"
+        assert results_of(table) == results_of(expected_processes), f"seed {seed}"
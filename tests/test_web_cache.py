@@ -0,0 +1,46 @@
+"""/api/schedule result cache keys.
+
+Parameters the chosen scheduler does not read must not split the cache;
+every parameter it does read must.
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+pytest.importorskip('flask')
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from web.app import app
+
+# (shared fields, fields that must not change the key, fields that must)
+CASES = [
+    ({'algorithm': 'FCFS'}, {'timeQuantum': 7, 'agingRate': 2, 'horizon': 50}, {'algorithm': 'SJF'}),
+    ({'algorithm': 'RR', 'timeQuantum': 2}, {'agingRate': 2, 'boostInterval': 9}, {'timeQuantum': 3}),
+    ({'algorithm': 'Priority'}, {'timeQuantum': 7}, {'agingRate': 0.5}),
+    ({'algorithm': 'MLFQ', 'levelQuanta': [1, 2]}, {'timeQuantum': 7}, {'boostInterval': 5}),
+    ({'algorithm': 'CFS'}, {'timeQuantum': 7, 'coreQueue': 'per-core'}, {'algorithm': 'SRTF'}),
+    ({'algorithm': 'Priority', 'cores': 2}, {'agingRate': 2, 'timeQuantum': 7},
+     {'coreQueue': 'per-core'}),
+    ({'algorithm': 'RR', 'cores': 2}, {'agingRate': 2}, {'timeQuantum': 5}),
+]
+
+def cache_status(client, processes, fields):
+    response = client.post('/api/schedule', json={'processes': processes, **fields})
+    assert response.status_code == 200
+    return response.headers['X-Cache']
+
+@pytest.mark.parametrize('shared, ignored, used', CASES)
+def test_cache_key_holds_only_used_parameters(shared, ignored, used):
+    client = app.test_client()
+    # A workload of its own, so entries from other tests cannot answer
+    rng = random.Random(repr(shared))
+    processes = [{'pid': f'P{pid}', 'arrivalTime': rng.randint(0, 10 ** 9),
+                  'burstTime': rng.randint(1, 9), 'priority': rng.randint(0, 5)}
+                 for pid in range(1, 20)]
+    assert cache_status(client, processes, shared) == 'MISS'
+    assert cache_status(client, processes, {**shared, **ignored}) == 'HIT'
+    assert cache_status(client, processes, {**shared, **used}) == 'MISS'
@@ -0,0 +1,140 @@
+"""/api/schedule response formats.
+
+A binary response is decoded here the way the frontend does it and must
+carry exactly the compact response, which in turn must describe the same
+schedule, process rows and metrics as the plain JSON response.
+"""
+
+import gzip
+import json
+import os
+import random
+import sys
+from array import array
+
+import pytest
+
+pytest.importorskip('flask')
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from web.app import app, BINARY_MAGIC, BINARY_VERSION, BINARY_HEADER, BINARY_FLOAT_TIMES
+
+def decode_binary(body):
+    """Returns the compact response carried by a binary body"""
+    magic, version, flags, count, metadata_length = BINARY_HEADER.unpack_from(body)
+    assert (magic, version) == (BINARY_MAGIC, BINARY_VERSION)
+    time_type = 'd' if flags & BINARY_FLOAT_TIMES else 'I'
+    offset = BINARY_HEADER.size
+    columns = []
+    for type_code in (time_type, time_type, 'I'):
+        column = array(type_code)
+        column.frombytes(body[offset:offset + count * column.itemsize])
+        if sys.byteorder == 'big':
+            column.byteswap()
+        columns.append([int(value) for value in column])
+        offset += count * column.itemsize
+    assert len(body) == offset + metadata_length
+    response = json.loads(body[offset:].decode())
+    starts, durations, pid_indices = columns
+    response['timeline'] = {'pids': response.pop('pids'), 'start': starts,
+                            'duration': durations, 'pid': pid_indices}
+    return response, flags
+
+def expanded(runs):
+    """Returns the (start, end, pid) runs of a compact timeline"""
+    return [(start, start + duration, runs['pids'][index])
+            for start, duration, index in zip(runs['start'], runs['duration'], runs['pid'])]
+
+def assert_same_schedule(runs, slices):
+    # JSON lists every slice by its start; compact merges back-to-back slices
+    # of one process, so every run starts with a slice and covers the
+    # slices of its process up to its end. Cores overlap, so match per pid.
+    starts = {(entry['time'], entry['pid']) for entry in slices}
+    assert all((start, pid) in starts for start, _, pid in runs)
+    for entry in slices:
+        assert any(start <= entry['time'] < end
+                   for start, end, pid in runs if pid == entry['pid']), entry
+
+def busy_times(runs):
+    busy = {}
+    for start, end, pid in runs:
+        busy[pid] = busy.get(pid, 0) + end - start
+    return busy
+
+def random_payload(seed):
+    rng = random.Random(seed)
+    algorithm = rng.choice(['FCFS', 'SJF', 'RR', 'Priority', 'SRTF', 'MLFQ', 'CFS'])
+    # Large offsets push times past 2**32, where binary times become float64
+    offset = rng.choice([0, 0, 5 * 10 ** 9])
+    processes = [{'pid': f'P{pid}', 'arrivalTime': offset + rng.randint(0, 30),
+                  'burstTime': rng.randint(1, 9), 'priority': rng.randint(0, 5)}
+                 for pid in range(1, rng.randint(1, 30) + 1)]
+    payload = {'algorithm': algorithm, 'processes': processes, 'timeQuantum': rng.randint(1, 4)}
+    if algorithm in ('FCFS', 'SJF', 'RR', 'Priority') and rng.random() < 0.5:
+        payload['cores'] = rng.randint(2, 4)
+        payload['coreQueue'] = rng.choice(['global', 'per-core'])
+    return payload
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+def post(client, payload, response_format):
+    response = client.post(f'/api/schedule?format={response_format}', json=payload)
+    assert response.status_code == 200
+    return response
+
+def test_binary_response_carries_the_compact_response(client):
+    for seed in range(40):
+        payload = random_payload(seed)
+        compact = post(client, payload, 'compact').get_json()
+        binary, flags = decode_binary(post(client, payload, 'binary').get_data())
+        assert binary == compact, f"seed {seed}"
+        uses_float = max(start + duration for start, duration in
+                         zip(compact['timeline']['start'], compact['timeline']['duration'])) >= 1 << 32
+        assert bool(flags & BINARY_FLOAT_TIMES) == uses_float, f"seed {seed}"
+
+def test_compact_response_matches_json(client):
+    for seed in range(40):
+        payload = random_payload(seed)
+        full = post(client, payload, 'json').get_json()
+        compact = post(client, payload, 'compact').get_json()
+
+        rows = full['processes']
+        bursts = {row['pid']: row['burstTime'] for row in rows}
+        runs = expanded(compact['timeline'])
+        assert_same_schedule(runs, full['timeline'])
+        assert busy_times(runs) == bursts, f"seed {seed}"
+        assert compact['processes'] == {field: [row[field] for row in rows] for field in rows[0]}, \
+            f"seed {seed}"
+        assert compact['metrics'] == full['metrics'], f"seed {seed}"
+
+        assert len(compact.get('cores', [])) == len(full.get('cores', [])), f"seed {seed}"
+        core_runs = []
+        for compact_core, full_core in zip(compact.get('cores', []), full.get('cores', [])):
+            runs = expanded(compact_core['timeline'])
+            assert_same_schedule(runs, full_core['timeline'])
+            assert compact_core['utilization'] == full_core['utilization'], f"seed {seed}"
+            core_runs.extend(runs)
+        if core_runs:
+            # Between them the cores run every process for its whole burst
+            assert busy_times(core_runs) == bursts, f"seed {seed}"
+
+def test_real_time_binary_response(client):
+    payload = {'algorithm': 'EDF', 'processes': [
+        {'pid': 'P1', 'arrivalTime': 0, 'burstTime': 2, 'deadline': 5, 'period': 5},
+        {'pid': 'P2', 'arrivalTime': 0, 'burstTime': 3, 'period': 10}]}
+    compact = post(client, payload, 'compact').get_json()
+    assert decode_binary(post(client, payload, 'binary').get_data())[0] == compact
+    assert compact['processes']['pid'] == ['P1.0', 'P2.0', 'P1.1']
+
+def test_compressed_binary_response(client):
+    payload = random_payload(3)
+    plain = post(client, payload, 'binary').get_data()
+    response = client.post('/api/schedule?format=binary', json=payload,
+                           headers={'Accept-Encoding': 'gzip'})
+    body = response.get_data()
+    if response.headers.get('Content-Encoding') == 'gzip':
+        body = gzip.decompress(body)
+    assert body == plain
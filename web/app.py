@@ -1,124 +1,720 @@
 import sys
 import os
+import copy
+import gzip
+import json
+import pickle
+import struct
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any
 import traceback
 
 # Add the project root to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
 from src.core.process import Process
-from src.core.scheduler import FCFSScheduler, SJFScheduler, RoundRobinScheduler, PriorityScheduler
+from src.core.scheduler import (FCFSScheduler, SJFScheduler, RoundRobinScheduler, PriorityScheduler,
+                                SRTFScheduler, PreemptivePriorityScheduler, MultiCoreScheduler,
+                                MLFQScheduler, CFSScheduler, RealTimeScheduler, EDFScheduler,
+                                RateMonotonicScheduler)
+from src.core.streaming_metrics import MetricsAccumulator
+from src.core.timeline import RunLengthTimeline
+from src.core.instrumentation import Instrumentation, NULL_INSTRUMENTATION
+from src.utils.result_cache import ResultCache, cache_key
+from src.utils.jobs import JobManager, DONE, FAILED
+
+try:
+    import brotli
+except ImportError:
+    # Optional: responses fall back to gzip
+    brotli = None
 
 app = Flask(__name__)
 
+# Scheduler factories by API algorithm name; each takes a parsed configuration
+SCHEDULERS = {
+    'FCFS': lambda config: FCFSScheduler(),
+    'SJF': lambda config: SJFScheduler(),
+    'RR': lambda config: RoundRobinScheduler(config['timeQuantum']),
+    'Priority': lambda config: PriorityScheduler(config['agingRate']),
+    'SRTF': lambda config: SRTFScheduler(),
+    'PreemptivePriority': lambda config: PreemptivePriorityScheduler(),
+    'MLFQ': lambda config: MLFQScheduler(config['levelQuanta'], config['boostInterval']),
+    'CFS': lambda config: CFSScheduler(),
+    'EDF': lambda config: EDFScheduler(config['horizon'], MAX_REAL_TIME_JOBS),
+    'RM': lambda config: RateMonotonicScheduler(config['horizon'], MAX_REAL_TIME_JOBS)
+}
+# Configuration fields each single-core scheduler above reads. Only these
+# (and the algorithm) go into cache keys, so a FCFS request with another
+# time quantum is served from the same cache entry.
+SCHEDULER_PARAMETERS = {
+    'RR': ('timeQuantum',),
+    'Priority': ('agingRate',),
+    'MLFQ': ('levelQuanta', 'boostInterval'),
+    'EDF': ('horizon',),
+    'RM': ('horizon',)
+}
+
+MAX_BATCH_CONFIGS = 64
+# Most jobs an EDF/RM request may release; beyond that clients pass a shorter
+# ``horizon`` instead of simulating whole hyperperiods
+MAX_REAL_TIME_JOBS = RealTimeScheduler.MAX_JOBS
+# NDJSON lines gathered into each chunk of a streamed response
+STREAM_CHUNK_LINES = 4096
+
+# Response formats of /api/schedule (?format=...) and their content types.
+# "compact" and "binary" send timelines as RunLengthTimeline columns and the
+# process rows as one list per field.
+RESPONSE_FORMATS = {
+    'json': 'application/json',
+    'compact': 'application/json',
+    'binary': 'application/octet-stream'
+}
+# Binary responses: a 16-byte little-endian header (magic, version, flags,
+# run count, metadata length), then run starts, durations and pid indices as
+# uint32 arrays, then the rest of the compact response as UTF-8 JSON. Times
+# past 2**32 set BINARY_FLOAT_TIMES, and starts and durations are float64
+# instead; they come first so those arrays are 8-byte aligned for JavaScript.
+BINARY_MAGIC = b'CPTL'
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct('<4sHHII')
+BINARY_FLOAT_TIMES = 1
+# Smaller responses are not worth compressing
+MIN_COMPRESS_BYTES = 1024
+# Batches with more work than this (processes x configurations) go to a
+# process pool; smaller ones run faster than the processes can be sent over
+PROCESS_POOL_THRESHOLD = 50000
+
+# Encoded responses of recent requests. SCHEDULER_CACHE_DB names an sqlite file
+# shared by every worker of the server; without it each worker caches alone.
+result_cache = ResultCache(
+    max_bytes=int(os.environ.get('SCHEDULER_CACHE_BYTES', 64 << 20)),
+    path=os.environ.get('SCHEDULER_CACHE_DB') or None,
+    max_disk_bytes=int(os.environ.get('SCHEDULER_CACHE_DISK_BYTES', 1 << 30)))
+
+# Background simulations for /api/jobs, run on a pool of SCHEDULER_JOB_WORKERS
+# processes (default: one per CPU). Jobs belong to the worker that accepted
+# them, so multi-worker servers need sticky sessions for polling.
+job_manager = JobManager(
+    workers=int(os.environ.get('SCHEDULER_JOB_WORKERS', 0)) or None,
+    max_jobs=int(os.environ.get('SCHEDULER_MAX_JOBS', 64)),
+    ttl=float(os.environ.get('SCHEDULER_JOB_TTL', 600)),
+    max_result_bytes=int(os.environ.get('SCHEDULER_JOB_RESULT_BYTES', 256 << 20)))
+# Slices between cancellation checks of a running job
+JOB_CHECK_SLICES = 1024
+
+# Lets clients of a production server ask for debug timings (see _request_instrumentation)
+DEBUG_TIMING = os.environ.get('SCHEDULER_DEBUG_TIMING', '') not in ('', '0', 'false')
+
+class RequestError(Exception):
+    """Invalid request data, answered with a 400 and the message"""
+
 @app.route('/')
 def index():
     return render_template('index.html')
 
-@app.route('/api/schedule', methods=['POST'])
-def schedule():
+def _request_instrumentation():
+    """Instrumentation for this request if asked for with ?debug=1 (or =profile)
+    or an X-Debug-Timing header with the same values. Only honoured in debug
+    mode or with SCHEDULER_DEBUG_TIMING set, as it bypasses the result cache"""
+    if not (app.debug or DEBUG_TIMING):
+        return NULL_INSTRUMENTATION
+    mode = request.args.get('debug') or request.headers.get('X-Debug-Timing')
+    if not mode or mode in ('0', 'false'):
+        return NULL_INSTRUMENTATION
+    return Instrumentation(profile=mode == 'profile')
+
+def _parse_config(data):
+    """Validates one algorithm configuration and returns it with defaults filled in"""
+    algorithm = data.get('algorithm')
+    if not algorithm:
+        raise RequestError('No algorithm specified')
+
+    # Extract and validate time quantum
     try:
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'No data provided'}), 400
+        time_quantum = int(data.get('timeQuantum', 2))
+    except (TypeError, ValueError):
+        raise RequestError('Invalid time quantum value')
+    if time_quantum < 1:
+        raise RequestError('Time quantum must be at least 1')
 
-        # Extract and validate algorithm
-        algorithm = data.get('algorithm')
-        if not algorithm:
-            return jsonify({'error': 'No algorithm specified'}), 400
+    # Extract and validate core count
+    try:
+        cores = int(data.get('cores', 1))
+    except (TypeError, ValueError):
+        raise RequestError('Invalid core count')
+    if not 1 <= cores <= 256:
+        raise RequestError('Core count must be between 1 and 256')
+    core_queue = data.get('coreQueue', 'global')
 
-        # Extract and validate processes
-        processes_data = data.get('processes', [])
-        if not processes_data:
-            return jsonify({'error': 'No processes provided'}), 400
+    # Extract and validate priority aging rate
+    try:
+        aging_rate = float(data.get('agingRate', 0))
+    except (TypeError, ValueError):
+        raise RequestError('Invalid aging rate value')
+    if aging_rate < 0:
+        raise RequestError('Aging rate cannot be negative')
+
+    # Extract and validate MLFQ levels (defaults double the quantum per level)
+    try:
+        level_quanta = [int(q) for q in data.get('levelQuanta') or
+                        [time_quantum, time_quantum * 2, time_quantum * 4]]
+        boost_interval = int(data.get('boostInterval') or 0) or None
+    except (TypeError, ValueError):
+        raise RequestError('Invalid MLFQ parameters')
+    if any(q < 1 for q in level_quanta):
+        raise RequestError('Each level quantum must be at least 1')
+    if boost_interval is not None and boost_interval < 1:
+        raise RequestError('Boost interval must be positive')
+
+    # Extract and validate the real-time horizon (default: one hyperperiod)
+    try:
+        horizon = data.get('horizon')
+        horizon = int(horizon) if horizon not in (None, '') else None
+    except (TypeError, ValueError):
+        raise RequestError('Invalid horizon value')
+    if horizon is not None and horizon < 1:
+        raise RequestError('Horizon must be at least 1')
+
+    if algorithm not in SCHEDULERS:
+        raise RequestError(f'Invalid algorithm: {algorithm}')
+    if cores > 1:
+        if algorithm not in MultiCoreScheduler.POLICIES:
+            raise RequestError(f'Algorithm {algorithm} does not support multiple cores')
+        if core_queue not in MultiCoreScheduler.QUEUE_MODES:
+            raise RequestError(f'Invalid core queue mode: {core_queue}')
+
+    return {
+        'algorithm': algorithm,
+        'timeQuantum': time_quantum,
+        'cores': cores,
+        'coreQueue': core_queue,
+        'agingRate': aging_rate,
+        'levelQuanta': level_quanta,
+        'boostInterval': boost_interval,
+        'horizon': horizon
+    }
+
+def _make_scheduler(config):
+    if config['cores'] > 1:
+        return MultiCoreScheduler(config['cores'], config['algorithm'], config['timeQuantum'],
+                                  config['coreQueue'])
+    return SCHEDULERS[config['algorithm']](config)
 
-        # Extract and validate time quantum
+def _parse_processes(processes_data, configs=()):
+    """Validates the request's process list and builds ``Process`` objects.
+
+    Real-time ``configs`` are checked against the processes too, so task sets
+    releasing more than ``MAX_REAL_TIME_JOBS`` jobs are rejected up front.
+    """
+    if not processes_data:
+        raise RequestError('No processes provided')
+
+    processes: List[Process] = []
+    for p in processes_data:
         try:
-            time_quantum = int(data.get('timeQuantum', 2))
-            if time_quantum < 1:
-                return jsonify({'error': 'Time quantum must be at least 1'}), 400
-        except ValueError:
-            return jsonify({'error': 'Invalid time quantum value'}), 400
-
-        # Create scheduler based on algorithm
-        scheduler_map = {
-            'FCFS': FCFSScheduler,
-            'SJF': SJFScheduler,
-            'RR': lambda: RoundRobinScheduler(time_quantum),
-            'Priority': PriorityScheduler
-        }
+            # Validate required fields
+            if any(key not in p for key in ['pid', 'arrivalTime', 'burstTime']):
+                raise RequestError('Missing required process fields')
+
+            # Extract and validate process values
+            pid = str(p['pid']).replace('P', '')
+            arrival_time = int(p['arrivalTime'])
+            burst_time = int(p['burstTime'])
+            priority = int(p.get('priority', 1))
+            deadline = p.get('deadline')
+            deadline = int(deadline) if deadline not in (None, '') else None
+            period = p.get('period')
+            period = int(period) if period not in (None, '') else None
+        except (TypeError, ValueError) as e:
+            raise RequestError(f'Invalid process data: {str(e)}')
+
+        if burst_time < 1:
+            raise RequestError(f'Process {str(pid)}: Burst time must be at least 1')
+        if arrival_time < 0:
+            raise RequestError(f'Process {str(pid)}: Arrival time cannot be negative')
+        if deadline is not None and deadline < 1:
+            raise RequestError(f'Process {str(pid)}: Deadline must be at least 1')
+        if period is not None and period < 1:
+            raise RequestError(f'Process {str(pid)}: Period must be at least 1')
+
+        processes.append(Process(
+            pid=pid,
+            arrival_time=arrival_time,
+            burst_time=burst_time,
+            priority=priority,
+            deadline=deadline,
+            period=period
+        ))
+
+    if not processes:
+        raise RequestError('No valid processes provided')
+
+    for config in configs:
+        if config['algorithm'] in ('EDF', 'RM'):
+            scheduler = _make_scheduler(config)
+            scheduler.processes = processes
+            jobs = scheduler.job_count()
+            if jobs > MAX_REAL_TIME_JOBS:
+                raise RequestError(f'Task set releases {jobs} jobs before time '
+                                   f'{scheduler.effective_horizon()}, more than '
+                                   f'{MAX_REAL_TIME_JOBS}; pass a shorter horizon')
+    return processes
+
+def _process_row(p):
+    return {
+        'pid': str(p),
+        'arrivalTime': p.arrival_time,
+        'burstTime': p.burst_time,
+        'priority': p.priority,
+        'deadline': p.deadline,
+        'period': p.period,
+        'waitingTime': p.waiting_time,
+        'turnaroundTime': p.turnaround_time
+    }
+
+def _metrics(accumulator, config):
+    # Only reads what MetricsAccumulator.complete() maintains
+    metrics = {
+        'avgWaitingTime': accumulator.waiting.mean,
+        'avgTurnaroundTime': accumulator.turnaround.mean
+    }
+    if accumulator.lateness.count:
+        metrics['deadlineMisses'] = accumulator.deadline_misses
+        metrics['maxLateness'] = accumulator.max_lateness
+    if config['cores'] > 1:
+        metrics['cpuUtilization'] = accumulator.summary()['cpu_utilization']
+    return metrics
+
+def _simulate(config, processes, instrumentation=NULL_INSTRUMENTATION, progress=None,
+              compact=False):
+    """Schedules ``processes`` (modifying them) and returns the response body.
+
+    ``progress`` is a job's ``JobProgress``, advanced once per completed process
+    and checked for cancellation every ``JOB_CHECK_SLICES`` slices.
+    With ``compact`` the timelines are ``RunLengthTimeline`` objects; see
+    ``_encode`` for turning such a response into bytes.
+    """
+    scheduler = _make_scheduler(config)
+
+    # Run scheduler, consuming slices and completions as they are produced
+    scheduler.processes = processes
+    if instrumentation.enabled:
+        scheduler.instrumentation = instrumentation
+    # _metrics needs completions only: no percentiles and no per-slice updates
+    accumulator = MetricsAccumulator(config['cores'], quantiles=())
+    complete = accumulator.complete
+    if progress is not None:
+        # Periodic tasks release an unknown number of jobs
+        progress.total = None if isinstance(scheduler, RealTimeScheduler) else len(processes)
 
-        scheduler_class = scheduler_map.get(algorithm)
-        if not scheduler_class:
-            return jsonify({'error': f'Invalid algorithm: {algorithm}'}), 400
-
-        scheduler = scheduler_class()
-
-        # Create processes
-        processes: List[Process] = []
-        for p in processes_data:
-            try:
-                # Validate required fields
-                if any(key not in p for key in ['pid', 'arrivalTime', 'burstTime']):
-                    return jsonify({'error': 'Missing required process fields'}), 400
-
-                # Extract and validate process values
-                pid = str(p['pid']).replace('P', '')  
-                arrival_time = int(p['arrivalTime'])
-                burst_time = int(p['burstTime'])
-                priority = int(p.get('priority', 1))
-
-                if burst_time < 1:
-                    return jsonify({'error': f'Process {str(pid)}: Burst time must be at least 1'}), 400
-                if arrival_time < 0:
-                    return jsonify({'error': f'Process {str(pid)}: Arrival time cannot be negative'}), 400
-
-                process = Process(
-                    pid=pid,
-                    arrival_time=arrival_time,
-                    burst_time=burst_time,
-                    priority=priority
-                )
-                processes.append(process)
-            except ValueError as e:
-                return jsonify({'error': f'Invalid process data: {str(e)}'}), 400
-
-        if not processes:
-            return jsonify({'error': 'No valid processes provided'}), 400
-
-        # Run scheduler
-        scheduler.processes = processes
-        timeline = scheduler.schedule()
-
-        # Format response
+        def complete(process):
+            accumulator.complete(process)
+            progress.advance()
+    timeline_data = RunLengthTimeline() if compact else []
+    slices = scheduler.iter_schedule(complete)
+    if progress is not None:
+        # Preemptive schedulers can run for long between completions
+        slices = _checked_slices(slices, progress)
+    for start, end, process in slices:
+        if compact:
+            timeline_data.append(start, end, str(process))
+        else:
+            timeline_data.append({'time': start, 'pid': str(process)})
+    if isinstance(scheduler, RealTimeScheduler):
+        # Periodic tasks expand into one row per released job
+        processes = scheduler.jobs
+
+    # Format response
+    with instrumentation.phase('response'):
         response: Dict[str, Any] = {
-            'timeline': [
-                {'time': t, 'pid': str(pid)} for t, pid in timeline  
-            ],
-            'processes': [
+            'timeline': timeline_data,
+            'processes': [_process_row(p) for p in processes],
+            'metrics': _metrics(accumulator, config)
+        }
+
+        if config['cores'] > 1:
+            response['cores'] = [
                 {
-                    'pid': str(p),  
-                    'arrivalTime': p.arrival_time,
-                    'burstTime': p.burst_time,
-                    'priority': p.priority,
-                    'waitingTime': p.waiting_time,
-                    'turnaroundTime': p.turnaround_time
+                    'core': core,
+                    'timeline': (_run_length(core_timeline, processes) if compact else
+                                 [{'time': t, 'pid': str(p)} for t, p in core_timeline.to_pairs(processes)]),
+                    'utilization': (busy / accumulator.total_time) * 100
                 }
-                for p in processes
-            ],
-            'metrics': {
-                'avgWaitingTime': sum(p.waiting_time for p in processes) / len(processes),
-                'avgTurnaroundTime': sum(p.turnaround_time for p in processes) / len(processes)
-            }
-        }
+                for core, (core_timeline, busy) in enumerate(
+                    zip(scheduler.core_timelines, scheduler.core_busy_times))
+            ]
+    return response
+
+def _checked_slices(slices, progress):
+    for count, item in enumerate(slices, 1):
+        if not count % JOB_CHECK_SLICES:
+            progress.check()
+        yield item
+
+def _run_length(timeline, processes):
+    runs = RunLengthTimeline()
+    for start, end, index in timeline:
+        runs.append(start, end, str(processes[index]))
+    return runs
+
+def _response_format():
+    response_format = request.args.get('format', 'json')
+    if response_format not in RESPONSE_FORMATS:
+        raise RequestError(f'Invalid response format: {response_format}')
+    return response_format
+
+def _encode(response, response_format):
+    """Returns the response body in ``response_format`` as bytes"""
+    if response_format == 'json':
+        return jsonify(response).get_data()
+
+    # Compact timelines become parallel lists, except the main one in binary
+    runs = response['timeline']
+    rows = response['processes']
+    body = dict(response, timeline=runs.to_dict(),
+                processes={field: [row[field] for row in rows] for field in (rows[0] if rows else ())})
+    if 'cores' in response:
+        body['cores'] = [dict(core, timeline=core['timeline'].to_dict()) for core in response['cores']]
+    if response_format == 'compact':
+        return jsonify(body).get_data()
+
+    del body['timeline']
+    body['pids'] = runs.pids
+    metadata = json.dumps(body, separators=(',', ':')).encode()
+    flags = 0
+    if runs and max(runs.starts) + max(runs.durations) >= 1 << 32:
+        flags |= BINARY_FLOAT_TIMES
+    time_type = 'd' if flags & BINARY_FLOAT_TIMES else 'I'
+    columns = [array(time_type, runs.starts), array(time_type, runs.durations),
+               array('I', runs.pid_indices)]
+    if sys.byteorder == 'big':
+        for column in columns:
+            column.byteswap()
+    return b''.join([BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, flags, len(runs), len(metadata))]
+                    + [column.tobytes() for column in columns] + [metadata])
+
+def _accepted_encoding():
+    """Best compression the client accepts: brotli when installed, else gzip, else None"""
+    if brotli is not None and request.accept_encodings['br']:
+        return 'br'
+    if request.accept_encodings['gzip']:
+        return 'gzip'
+    return None
+
+def _compress(body, encoding):
+    if encoding == 'br':
+        # Quality 5 compresses close to the maximum at a fraction of its time
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6)
+
+@app.after_request
+def _compress_response(response):
+    """Compresses larger buffered responses that are not encoded yet"""
+    response.vary.add('Accept-Encoding')
+    if (response.is_streamed or response.direct_passthrough
+            or 'Content-Encoding' in response.headers):
+        return response
+    body = response.get_data()
+    encoding = _accepted_encoding()
+    if encoding is None or len(body) < MIN_COMPRESS_BYTES:
+        return response
+    response.set_data(_compress(body, encoding))
+    response.headers['Content-Encoding'] = encoding
+    return response
 
-        return jsonify(response)
+def _wants_stream():
+    """True for ?stream=1 (or =ndjson) or when NDJSON is the preferred response type"""
+    return (request.args.get('stream') in ('1', 'ndjson')
+            or request.accept_mimetypes.best == 'application/x-ndjson')
 
+def _stream_simulation(config, processes, instrumentation):
+    """Yields the simulation as NDJSON chunks while the scheduler produces it.
+
+    Every line is an object tagged by ``type``: a ``slice`` per timeline
+    entry, a ``process`` row as each process finishes (so rows come in
+    completion order), then ``metrics`` with per-core utilization for
+    multi-core runs and, for debug requests, ``debug``. Multi-core runs keep
+    no per-core timelines and EDF/RM keep no released jobs, so nothing grows
+    with the timeline and memory stays flat however long the schedule runs.
+    """
+    scheduler = _make_scheduler(config)
+    scheduler.processes = processes
+    if isinstance(scheduler, MultiCoreScheduler):
+        # Only core_busy_times is needed for the summary
+        scheduler.record_core_timelines = False
+    if isinstance(scheduler, RealTimeScheduler):
+        # Each job is sent as it finishes
+        scheduler.keep_jobs = False
+    if instrumentation.enabled:
+        scheduler.instrumentation = instrumentation
+    accumulator = MetricsAccumulator(config['cores'], quantiles=())
+    finished = []
+
+    def complete(process):
+        accumulator.complete(process)
+        finished.append(process)
+
+    encode = json.JSONEncoder(separators=(',', ':')).encode
+    lines = []
+    try:
+        for start, end, process in scheduler.iter_schedule(complete):
+            lines.append(encode({'type': 'slice', 'time': start, 'end': end, 'pid': str(process)}))
+            if finished:
+                lines.extend(encode({'type': 'process', **_process_row(p)}) for p in finished)
+                finished.clear()
+            if len(lines) >= STREAM_CHUNK_LINES:
+                yield '\n'.join(lines) + '\n'
+                lines.clear()
+        lines.extend(encode({'type': 'process', **_process_row(p)}) for p in finished)
+
+        summary = {'type': 'metrics', 'metrics': _metrics(accumulator, config)}
+        if config['cores'] > 1:
+            summary['cores'] = [{'core': core, 'utilization': (busy / accumulator.total_time) * 100}
+                                for core, busy in enumerate(scheduler.core_busy_times)]
+        lines.append(encode(summary))
+        if instrumentation.enabled:
+            lines.append(encode({'type': 'debug', **instrumentation.report()}))
+    except Exception as e:
+        # The status line has gone out already; all that is left is to say so in-band
+        app.logger.error(f'Error while streaming schedule: {str(e)}')
+        app.logger.error(traceback.format_exc())
+        lines.append(encode({'type': 'error', 'error': 'Internal server error'}))
+    yield '\n'.join(lines) + '\n'
+
+def _scheduler_parameters(config):
+    """Returns the algorithm and the fields of ``config`` its scheduler reads"""
+    if config['cores'] > 1:
+        names = ('cores', 'coreQueue') + (('timeQuantum',) if config['algorithm'] == 'RR' else ())
+    else:
+        names = SCHEDULER_PARAMETERS.get(config['algorithm'], ())
+    return {'algorithm': config['algorithm'], **{name: config[name] for name in names}}
+
+def _workload_key(kind, configs, processes):
+    """Cache key of a request: its configuration(s) and process fields"""
+    return cache_key(kind, configs, [(str(p), p.arrival_time, p.burst_time, p.priority,
+                                      p.deadline, p.period) for p in processes])
+
+def _cached(key, compute, response_format='json'):
+    """Returns a response for ``key``, encoding ``compute()`` only on a miss.
+
+    Each format and content encoding is cached separately, so a hit sends
+    stored bytes without encoding or compressing anything.
+    """
+    encoding = _accepted_encoding()
+    variant = f'{key}:{response_format}:{encoding or "identity"}'
+    body = result_cache.get(variant)
+    status = 'HIT'
+    if body is None:
+        body = _encode(compute(), response_format)
+        if encoding is not None:
+            body = _compress(body, encoding)
+        result_cache.put(variant, body)
+        status = 'MISS'
+    result = app.response_class(body, mimetype=RESPONSE_FORMATS[response_format])
+    if encoding is not None:
+        result.headers['Content-Encoding'] = encoding
+    result.headers['X-Cache'] = status
+    return result
+
+def _respond(response, instrumentation, response_format='json'):
+    """Encodes ``response`` in ``response_format``, adding debug timings when enabled"""
+    if instrumentation.enabled:
+        response['debug'] = instrumentation.report()
+    with instrumentation.phase('encode'):
+        result = app.response_class(_encode(response, response_format),
+                                    mimetype=RESPONSE_FORMATS[response_format])
+    if instrumentation.enabled:
+        # Encoding finishes after the debug field is built, so it only shows up here
+        result.headers['Server-Timing'] = instrumentation.server_timing()
+    return result
+
+@app.route('/api/schedule', methods=['POST'])
+def schedule():
+    instrumentation = _request_instrumentation()
+    try:
+        with instrumentation.phase('parse'):
+            data = request.get_json()
+            if not data:
+                return jsonify({'error': 'No data provided'}), 400
+            if not data.get('algorithm'):
+                return jsonify({'error': 'No algorithm specified'}), 400
+            if not data.get('processes'):
+                return jsonify({'error': 'No processes provided'}), 400
+            config = _parse_config(data)
+            processes = _parse_processes(data['processes'], [config])
+            response_format = _response_format()
+
+        if _wants_stream():
+            return Response(_stream_simulation(config, processes, instrumentation),
+                            mimetype='application/x-ndjson')
+        compact = response_format != 'json'
+        if instrumentation.enabled:
+            # Timings must describe a real run, so debug requests skip the cache
+            return _respond(_simulate(config, processes, instrumentation, compact=compact),
+                            instrumentation, response_format)
+        return _cached(_workload_key('schedule', _scheduler_parameters(config), processes),
+                       lambda: _simulate(config, processes, compact=compact), response_format)
+
+    except RequestError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         app.logger.error(f'Error in schedule endpoint: {str(e)}')
         app.logger.error(traceback.format_exc())
         return jsonify({'error': 'Internal server error'}), 500
 
+# Process pool shared by every large batch, started by the first one
+_batch_executor = None
+_batch_lock = threading.Lock()
+
+def _batch_pool():
+    global _batch_executor
+    with _batch_lock:
+        if _batch_executor is None:
+            _batch_executor = ProcessPoolExecutor()
+        return _batch_executor
+
+def _simulate_batch_config(config, pickled_processes):
+    # Unpickling gives this configuration its own copy of the processes
+    return _simulate(config, pickle.loads(pickled_processes))
+
+def _run_batch(configs, processes):
+    """Runs every configuration on its own copy of ``processes``, in input order.
+
+    Large batches fan out over a process pool that lives as long as the
+    server, with the processes pickled once and sent along with each
+    configuration. Small ones run one after another in the request thread,
+    as threads would only take turns on the GIL.
+    """
+    if (len(configs) > 1 and (os.cpu_count() or 1) > 1
+            and len(processes) * len(configs) >= PROCESS_POOL_THRESHOLD):
+        pickled = pickle.dumps(processes, pickle.HIGHEST_PROTOCOL)
+        return list(_batch_pool().map(_simulate_batch_config, configs, [pickled] * len(configs)))
+    return [_simulate(config, [copy.copy(p) for p in processes]) for config in configs]
+
+@app.route('/api/schedule/batch', methods=['POST'])
+def schedule_batch():
+    """Runs several algorithm configurations on one process set.
+
+    The body holds ``processes`` and a ``configs`` list of configurations as
+    accepted by ``/api/schedule``; fields given next to ``processes`` (such
+    as ``cores``) are defaults for every configuration. The processes are
+    validated once and each result carries its normalized ``config``.
+    """
+    instrumentation = _request_instrumentation()
+    try:
+        with instrumentation.phase('parse'):
+            data = request.get_json()
+            if not data:
+                return jsonify({'error': 'No data provided'}), 400
+            configs_data = data.get('configs')
+            if not configs_data or not isinstance(configs_data, list):
+                return jsonify({'error': 'No configurations provided'}), 400
+            if len(configs_data) > MAX_BATCH_CONFIGS:
+                return jsonify({'error': f'At most {MAX_BATCH_CONFIGS} configurations per batch'}), 400
+
+            defaults = {key: value for key, value in data.items() if key not in ('processes', 'configs')}
+            configs = []
+            for position, config in enumerate(configs_data):
+                if not isinstance(config, dict):
+                    return jsonify({'error': f'Configuration {position}: must be an object'}), 400
+                try:
+                    configs.append(_parse_config({**defaults, **config}))
+                except RequestError as e:
+                    return jsonify({'error': f'Configuration {position}: {str(e)}'}), 400
+            processes = _parse_processes(data.get('processes'), configs)
+
+        def run():
+            results = _run_batch(configs, processes)
+            return {'results': [{'config': config, **result} for config, result in zip(configs, results)]}
+
+        if instrumentation.enabled:
+            with instrumentation.phase('schedule'):
+                response = run()
+            return _respond(response, instrumentation)
+        # Results echo each full config, so unlike /api/schedule the key keeps it
+        return _cached(_workload_key('batch', configs, processes), run)
+
+    except RequestError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        app.logger.error(f'Error in batch schedule endpoint: {str(e)}')
+        app.logger.error(traceback.format_exc())
+        return jsonify({'error': 'Internal server error'}), 500
+
+def _simulate_job(config, processes, progress):
+    # Runs in a job worker; encoding there keeps the request threads free
+    return json.dumps(_simulate(config, processes, progress=progress), separators=(',', ':')).encode()
+
+@app.route('/api/jobs', methods=['POST'])
+def submit_job():
+    """Validates a /api/schedule request and queues it as a background job.
+
+    Answers 202 with the job id; poll ``/api/jobs/<id>`` for progress and
+    fetch ``/api/jobs/<id>/result`` once it is done.
+    """
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({'error': 'No data provided'}), 400
+        if not data.get('algorithm'):
+            return jsonify({'error': 'No algorithm specified'}), 400
+        if not data.get('processes'):
+            return jsonify({'error': 'No processes provided'}), 400
+        config = _parse_config(data)
+        processes = _parse_processes(data['processes'], [config])
+
+        job_id = job_manager.submit(_simulate_job, config, processes)
+        if job_id is None:
+            return jsonify({'error': 'Too many jobs, try again later'}), 429
+        result = jsonify(job_manager.status(job_id))
+        result.status_code = 202
+        result.headers['Location'] = f'/api/jobs/{job_id}'
+        return result
+
+    except RequestError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        app.logger.error(f'Error in job submission: {str(e)}')
+        app.logger.error(traceback.format_exc())
+        return jsonify({'error': 'Internal server error'}), 500
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """State of a job with ``completed`` of ``total`` processes (total is null for EDF/RM)"""
+    status = job_manager.status(job_id)
+    if status is None:
+        return jsonify({'error': 'Unknown or expired job'}), 404
+    return jsonify(status)
+
+@app.route('/api/jobs/<job_id>/result', methods=['GET'])
+def job_result(job_id):
+    """The finished job's /api/schedule response; 409 while it is not done"""
+    outcome = job_manager.result(job_id)
+    if outcome is None:
+        return jsonify({'error': 'Unknown or expired job'}), 404
+    status, body = outcome
+    if status == DONE:
+        return app.response_class(body, mimetype='application/json')
+    if status == FAILED:
+        app.logger.error(f'Job {job_id} failed: {job_manager.status(job_id).get("error")}')
+        return jsonify({'error': 'Internal server error', 'status': status}), 500
+    return jsonify({'error': f'Job is {status}', 'status': status}), 409
+
+@app.route('/api/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    """Cancels a queued or running job; the result is the job's status"""
+    if not job_manager.cancel(job_id):
+        return jsonify({'error': 'Unknown or expired job'}), 404
+    return jsonify(job_manager.status(job_id))
+
+@app.route('/api/cache', methods=['GET'])
+def cache_stats():
+    """Hit, miss and eviction counters of this worker plus the size of each cache tier"""
+    return jsonify(result_cache.stats())
+
 if __name__ == '__main__':
     app.run(debug=True)
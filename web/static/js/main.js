@@ -87,7 +87,7 @@ themeToggle.addEventListener('change', (e) => setTheme(e.target.checked));
 // Show/hide time quantum input based on algorithm selection
 algorithmSelect.addEventListener('change', () => {
     const container = document.getElementById('timeQuantumContainer');
-    if (algorithmSelect.value === 'RR') {
+    if (algorithmSelect.value === 'RR' || algorithmSelect.value === 'MLFQ') {
         container.style.display = 'block';
         container.style.animation = 'fadeIn 0.3s ease-in-out';
     } else {
@@ -239,7 +239,44 @@ const updateProcess = (pid, field, value) => {
     }
 };
 
-let lastTimelineData = [];
+let lastTimelineData = null;
+
+// Binary schedule responses (/api/schedule?format=binary, see web/app.py):
+// a 16-byte header, run starts, durations and pid indices, then JSON metadata
+const BINARY_FLOAT_TIMES = 1;
+
+const decodeSchedule = (buffer) => {
+    const view = new DataView(buffer);
+    const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+    if (magic !== 'CPTL' || view.getUint16(4, true) !== 1) {
+        throw new Error('Unsupported schedule response');
+    }
+    const flags = view.getUint16(6, true);
+    const runs = view.getUint32(8, true);
+    const metadataLength = view.getUint32(12, true);
+
+    // The columns are views into the response, nothing is copied
+    let offset = 16;
+    const TimeArray = (flags & BINARY_FLOAT_TIMES) ? Float64Array : Uint32Array;
+    const start = new TimeArray(buffer, offset, runs);
+    offset += start.byteLength;
+    const duration = new TimeArray(buffer, offset, runs);
+    offset += duration.byteLength;
+    const pid = new Uint32Array(buffer, offset, runs);
+    offset += pid.byteLength;
+
+    const data = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, offset, metadataLength)));
+    data.timeline = { pids: data.pids, start, duration, pid };
+    return data;
+};
+
+// Compact responses send one list per process field; the table wants rows
+const processRows = (columns) => {
+    const fields = Object.keys(columns);
+    const count = fields.length ? columns[fields[0]].length : 0;
+    return Array.from({ length: count }, (_, i) =>
+        Object.fromEntries(fields.map(field => [field, columns[field][i]])));
+};
 
 // Generate colors for Gantt chart
 const generateColors = (count) => {
@@ -260,18 +297,23 @@ const updateGanttChart = (timeline) => {
         ganttChart.destroy();
     }
 
-    const uniquePids = [...new Set(timeline.map(t => t.pid))];
+    // Runs are columns: start, duration and an index into pids
+    const uniquePids = timeline.pids;
     const colors = generateColors(uniquePids.length);
     const colorMap = Object.fromEntries(uniquePids.map((pid, i) => [pid, colors[i]]));
 
-    const datasets = uniquePids.map(pid => ({
+    const points = uniquePids.map(() => []);
+    for (let i = 0; i < timeline.start.length; i++) {
+        const row = timeline.pid[i];
+        points[row].push(
+            { x: timeline.start[i], y: row },
+            { x: timeline.start[i] + timeline.duration[i], y: row }
+        );
+    }
+
+    const datasets = uniquePids.map((pid, row) => ({
         label: pid,
-        data: timeline
-            .filter(t => t.pid === pid)
-            .map(t => ([
-                { x: t.time, y: uniquePids.indexOf(pid) },
-                { x: t.time + 1, y: uniquePids.indexOf(pid) }
-            ])).flat(),
+        data: points[row],
         backgroundColor: colorMap[pid],
         borderColor: colorMap[pid],
         borderWidth: 2,
@@ -370,7 +412,7 @@ const runSimulation = async () => {
     runBtn.disabled = true;
 
     try {
-        const response = await fetch('/api/schedule', {
+        const response = await fetch('/api/schedule?format=binary', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json'
@@ -382,11 +424,11 @@ const runSimulation = async () => {
             })
         });
 
-        const data = await response.json();
-
-        if (data.error) {
-            throw new Error(data.error);
+        if (!response.ok) {
+            const error = await response.json();
+            throw new Error(error.error);
         }
+        const data = decodeSchedule(await response.arrayBuffer());
 
         // Update Gantt Chart with animation
         updateGanttChart(data.timeline);
@@ -413,7 +455,7 @@ const runSimulation = async () => {
         });
 
         // Update process table with results
-        processes = data.processes;
+        processes = processRows(data.processes);
         updateProcessTable();
 
     } catch (error) {